@@ -2,6 +2,7 @@ import cv2
 import numpy as np
 import logging
 import threading
+import time
 
 logger = logging.getLogger("main")
 
@@ -70,13 +71,14 @@ class BodySegmenter:
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=small_rgb)
         
         # Run segmentation with strictly increasing timestamps
-        import time
         if not hasattr(self, '_last_timestamp'):
             self._last_timestamp = 0
             self._timestamp_lock = threading.Lock()
             
         with self._timestamp_lock:
-            timestamp_ms = int(time.time() * 1000)
+            # Monotonic clock: an NTP step back on time.time() would pin every
+            # frame to last+1 ms until the wall clock caught up again
+            timestamp_ms = int(time.monotonic() * 1000)
             if timestamp_ms <= self._last_timestamp:
                 timestamp_ms = self._last_timestamp + 1
             self._last_timestamp = timestamp_ms
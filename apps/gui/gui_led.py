@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk
 import time
 import threading
+import queue
 import numpy as np
 import serial
 import os
@@ -37,6 +38,9 @@ from packages.mirror_core.verification.visual_verifier import VisualVerifier
 
 logger = setup_logging()
 
+PING_PACKET = b'\xAA\xBB\x05'  # Firmware answers with "PONG"
+LOG_FLUSH_MS = 50  # Terminal lines are batched into one widget update per interval
+
 class LEDApp:
     def __init__(self, root):
         self.root = root
@@ -63,13 +67,25 @@ class LEDApp:
         self._latest_frame_id = None
         self._max_resend_attempts = 3
         self._resend_attempts = 0
-        self._last_failsafe_ts = 0.0
+        self._last_failsafe_ts = float('-inf')
         
         # Heartbeat state
         self._heartbeat_running = False
         self._heartbeat_thread = None
+        self._ping_sent_at = None  # perf_counter() of the last unanswered PING
+        self._heartbeat_interval = 0.1
+        self._last_write_ts = 0.0  # monotonic() of the last successful write
+        
+        # Frame writer: UART time overlaps with preparing the next frame.
+        # Depth 1 - a newer frame replaces one that hasn't been sent yet.
+        self._write_queue = queue.Queue(maxsize=1)
+        self._writer_running = False
+        self._writer_thread = None
         
         self._terminal_paused = False
+        self._log_pending = []  # Formatted lines waiting for the next terminal flush
+        self._log_flush_scheduled = False
+        self._log_lock = threading.Lock()
         
         # Calibration state
         self._manual_calib_mode = False
@@ -213,18 +229,39 @@ class LEDApp:
         self.log_text.config(state='disabled')
 
     def _log(self, msg):
+        timestamp = time.strftime("%H:%M:%S")
+        logger.info(msg) # Always log to disk
+        
+        if self._terminal_paused:
+            return # Don't update UI if paused
+        
+        # Queue the line; bursts from the frame/serial threads become one insert
+        with self._log_lock:
+            self._log_pending.append(f"[{timestamp}] {msg}\n")
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        try:
+            self.root.after(LOG_FLUSH_MS, self._flush_log)
+        except (tk.TclError, RuntimeError):
+            with self._log_lock:
+                self._log_flush_scheduled = False  # Root gone during shutdown
+
+    def _flush_log(self):
+        """Write all queued terminal lines with a single widget update (Tk thread)"""
+        with self._log_lock:
+            text = ''.join(self._log_pending)
+            self._log_pending.clear()
+            self._log_flush_scheduled = False
+        if not text:
+            return
         try:
-            timestamp = time.strftime("%H:%M:%S")
-            logger.info(msg) # Always log to disk
-            
-            if self._terminal_paused:
-                return # Don't update UI if paused
-                
             self.log_text.config(state='normal')
-            self.log_text.insert('end', f"[{timestamp}] {msg}\n")
+            self.log_text.insert('end', text)
             self.log_text.see('end')
             self.log_text.config(state='disabled')
-        except: pass
+        except (tk.TclError, AttributeError):
+            pass  # Widget gone during shutdown, or not built yet
 
     def _toggle_terminal_pause(self):
         self._terminal_paused = not self._terminal_paused
@@ -240,6 +277,7 @@ class LEDApp:
         self._log(f"Connected: {port if port else 'SIM'}")
         if self.serial_port is not None:
             self._start_feedback_thread()
+            self._start_writer()
             self._start_heartbeat()
             # Send initial ping to verify connection
             self._send_ping()
@@ -274,17 +312,14 @@ class LEDApp:
             
             # 2. UPDATE SIMULATOR with the appropriate source
             if self._viz_mode == "test":
-                self.led_viz.update_leds(remapped_frame.flatten().tolist())
+                self.led_viz.update_leds(remapped_frame)
             
             # 3. SEND TO HARDWARE
             if self.serial_port:
                 # Use 1-bit packing (0x03) - compatible with firmware v2.0
                 self.frame_id = (self.frame_id + 1) % 65536
                 packet = self.led_controller.pack_remapped_led_packet_1bit(remapped_frame)
-                if self._safe_serial_write(packet):
-                    self._latest_packet = packet
-                    self._latest_frame_id = self.frame_id
-                    self._resend_attempts = 0
+                self._queue_frame(self.frame_id, packet)
             
             # 4. CLOSED-LOOP VERIFICATION & ADVANCED VIZ
             if self.running and self.camera_panel and self.camera_panel.camera_thread:
@@ -303,10 +338,10 @@ class LEDApp:
                         if self._viz_mode == "calib" and 'warped' in metrics:
                             # Show rectified physical feedback
                             warped = cv2.resize(metrics['warped'], (32, 64))
-                            self.led_viz.update_leds(warped.flatten().tolist())
+                            self.led_viz.update_leds(warped)
                         elif self._viz_mode == "live":
                             # Show segmented mask logic
-                            self.led_viz.update_leds(remapped_frame.flatten().tolist())
+                            self.led_viz.update_leds(remapped_frame)
                         
                         # Fail-safe Logic
                         if ber > 0.15: # 15% error threshold
@@ -346,7 +381,7 @@ class LEDApp:
         """Called when verification fails (High BER)"""
         if self.frame_id % 30 == 0:
             self._log(f"High Error Rate: {ber*100:.1f}%")
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_failsafe_ts > 10.0:
             self._last_failsafe_ts = now
             self._log("Auto-recalibration triggered by failsafe")
@@ -528,7 +563,12 @@ class LEDApp:
                         if line.startswith("NACK"):
                             self._handle_nack()
                         elif "PONG" in line:
-                            self._log("SUCCESS: Two-way communication verified!")
+                            sent_at, self._ping_sent_at = self._ping_sent_at, None
+                            if sent_at is not None:
+                                rtt_ms = (time.perf_counter() - sent_at) * 1000
+                                self._log(f"SUCCESS: Two-way communication verified! (RTT {rtt_ms:.1f} ms)")
+                            else:
+                                self._log("SUCCESS: Two-way communication verified!")
                 except Exception:
                     self._log(f"ESP32 raw: {raw.hex()}")
                     
@@ -551,6 +591,41 @@ class LEDApp:
                 f"(attempt {self._resend_attempts}/{self._max_resend_attempts})"
             )
 
+    def _start_writer(self):
+        """Start the background thread that writes queued LED frames."""
+        if self._writer_running:
+            return
+        self._writer_running = True
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+    def _queue_frame(self, frame_id, packet):
+        """Hand a packed frame to the writer, replacing any unsent older frame."""
+        item = (frame_id, packet)
+        try:
+            self._write_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._write_queue.get_nowait()  # Stale frame - drop it
+            except queue.Empty:
+                pass
+            try:
+                self._write_queue.put_nowait(item)
+            except queue.Full:
+                pass  # Lost the race to another producer; its frame is newer
+
+    def _writer_loop(self):
+        """Write queued frames so the caller never blocks on the UART."""
+        while self.running and self._writer_running:
+            try:
+                frame_id, packet = self._write_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if self._safe_serial_write(packet):
+                self._latest_packet = packet
+                self._latest_frame_id = frame_id
+                self._resend_attempts = 0
+
     def _start_heartbeat(self):
         """Start the heartbeat thread to keep LEDs alive (v2.0 firmware compatibility)"""
         if self._heartbeat_running:
@@ -565,29 +640,31 @@ class LEDApp:
         ser = self.serial_port
         if ser:
             self._log(f"Sending PING [AA BB 05] to {getattr(ser, 'port', '?')}...")
-            ok = self._safe_serial_write(bytes([0xAA, 0xBB, 0x05]))
+            # The feedback thread reports the PONG (and round-trip time) as soon
+            # as it arrives, so there is no fixed sleep blocking the UI here
+            self._ping_sent_at = time.perf_counter()
+            ok = self._safe_serial_write(PING_PACKET)
             if ok:
                 self._log("PING sent OK. Waiting for PONG...")
-                # Also log how many bytes are waiting (diagnostic)
-                try:
-                    time.sleep(0.1)  # Give firmware time to respond
-                    waiting = getattr(ser, 'in_waiting', 0)
-                    self._log(f"Bytes waiting from ESP32: {waiting}")
-                except: pass
             else:
+                self._ping_sent_at = None
                 self._log("PING FAILED: serial write returned False!")
         else:
             self._log("Cannot ping: no serial port connected.")
 
     def _heartbeat_loop(self):
-        """Continuously resend the latest packet every 100ms to prevent firmware timeout."""
+        """Resend the latest packet whenever the link has been idle for 100ms to prevent firmware timeout."""
+        interval = self._heartbeat_interval
         while self.running and self._heartbeat_running:
             try:
-                if self.serial_port and self._latest_packet:
+                # Live frames already keep the firmware fed - only fill gaps
+                idle = time.monotonic() - self._last_write_ts
+                if idle >= interval and self.serial_port and self._latest_packet:
                     self._safe_serial_write(self._latest_packet)
+                    idle = 0.0
             except Exception:
-                pass
-            time.sleep(0.1) # 10 FPS heartbeat
+                idle = 0.0
+            time.sleep(max(interval - idle, 0.01)) # 10 FPS heartbeat when idle
 
     def _safe_serial_write(self, packet):
         ser = self.serial_port
@@ -598,6 +675,7 @@ class LEDApp:
                 if not getattr(ser, "is_open", False):
                     return False
                 ser.write(packet)
+            self._last_write_ts = time.monotonic()
             return True
         except (serial.SerialTimeoutException, serial.SerialException, OSError):
             return False
@@ -608,6 +686,7 @@ class LEDApp:
         self.running = False
         self._feedback_running = False
         self._heartbeat_running = False
+        self._writer_running = False
         if self.camera_panel: self.camera_panel.stop()
         if self.connection_panel: self.connection_panel.monitor_running = False
 
@@ -635,7 +714,8 @@ if __name__ == "__main__":
         root.geometry("1200x800")
         try:
             root.state('zoomed')
-        except: pass
+        except tk.TclError:
+            pass  # 'zoomed' is Windows-only
         app = LEDApp(root)
         root.protocol("WM_DELETE_WINDOW", lambda: (app.stop(), root.destroy()))
         root.mainloop()
@@ -42,6 +42,7 @@ class CameraPanel(tk.Frame):
         
         # Shared state between threads
         self._last_seg_mask = None  # Last segmentation result for overlay
+        self._overlay_cache = None  # (seg_mask, (w, h), body_pixels) for the overlay
         self._last_imgtk = None     # Keep reference to prevent GC
         self.tracking_sync_mode = True  # Default: SYNC ALL
         self.tracking_invert = False
@@ -209,12 +210,12 @@ class CameraPanel(tk.Frame):
         while not self._frame_queue.empty():
             try:
                 self._frame_queue.get_nowait()
-            except:
+            except queue.Empty:
                 pass
         while not self._seg_queue.empty():
             try:
                 self._seg_queue.get_nowait()
-            except:
+            except queue.Empty:
                 pass
         
         # Reset shared state
@@ -258,12 +259,12 @@ class CameraPanel(tk.Frame):
         while not self._frame_queue.empty():
             try:
                 self._frame_queue.get_nowait()
-            except:
+            except queue.Empty:
                 pass
         while not self._seg_queue.empty():
             try:
                 self._seg_queue.get_nowait()
-            except:
+            except queue.Empty:
                 pass
         
         if self.start_btn:
@@ -323,10 +324,10 @@ class CameraPanel(tk.Frame):
                     if self._frame_queue.full():
                         try:
                             self._frame_queue.get_nowait()
-                        except:
+                        except queue.Empty:
                             pass
                     self._frame_queue.put_nowait(frame.copy())
-                except:
+                except queue.Full:
                     pass
                 
                 # Put frame in SEGMENTATION queue (for motor control)
@@ -335,10 +336,10 @@ class CameraPanel(tk.Frame):
                     if self._seg_queue.full():
                         try:
                             self._seg_queue.get_nowait()
-                        except:
+                        except queue.Empty:
                             pass
                     self._seg_queue.put_nowait(frame)
-                except:
+                except queue.Full:
                     pass
                     
             except Exception as e:
@@ -354,13 +355,14 @@ class CameraPanel(tk.Frame):
         # Lower threshold for more sensitive detection (0.1% of pixels)
         body_threshold = self.PROC_WIDTH * self.PROC_HEIGHT * 0.001 * 255
         frame_count = 0
+        seg_get = self._seg_queue.get  # Bound once; the queue never changes
         
         while self.running:
             try:
                 # Wait for a frame (with timeout to allow clean shutdown)
                 try:
-                    frame = self._seg_queue.get(timeout=0.1)
-                except:
+                    frame = seg_get(timeout=0.1)
+                except queue.Empty:
                     continue
                 
                 if frame is None:
@@ -403,14 +405,17 @@ class CameraPanel(tk.Frame):
                 # Update shared state for display
                 self.body_detected = body_detected
                 self._last_seg_mask = seg_mask
+                # Callbacks can be swapped at runtime, so look them up once per frame
+                on_angle_change = self.on_angle_change
+                on_detection_change = getattr(self, 'on_detection_change', None)
                 
                 # 1. ALWAYS calculate the silhouette for the DETECTION grid
                 if seg_mask is not None:
                     mask_8x8 = cv2.resize(seg_mask, (8, 8), interpolation=cv2.INTER_AREA)
-                    silhouette = (mask_8x8.flatten() > 50).astype(np.uint8) * 180
+                    silhouette = ((mask_8x8.ravel() > 50).astype(np.uint8) * 180).tolist()
                     # Update detection UI independently
-                    if hasattr(self, 'on_detection_change') and self.on_detection_change:
-                        self.on_detection_change(silhouette.tolist())
+                    if on_detection_change:
+                        on_detection_change(silhouette)
 
                 # 2. Calculate Motor Angles based on Mode
                 if body_detected and seg_mask is not None:
@@ -425,16 +430,19 @@ class CameraPanel(tk.Frame):
                         # Apply Horizontal Flip to mask if Invert is enabled
                         if getattr(self, 'tracking_invert', False):
                             mask_8x8 = cv2.flip(mask_8x8, 1)
-                            
-                        motor_angles = (mask_8x8.flatten() > 50).astype(np.uint8) * 180
-                        if self.on_angle_change:
-                            self.on_angle_change(motor_angles.tolist())
+                            motor_angles = ((mask_8x8.ravel() > 50).astype(np.uint8) * 180).tolist()
+                        else:
+                            # Unflipped: same values as the detection silhouette
+                            # (own copy, so the two consumers never share a list)
+                            motor_angles = list(silhouette)
+                        if on_angle_change:
+                            on_angle_change(motor_angles)
                             
                 elif frame_count % 10 == 0: # Idle reset
-                    if self.on_angle_change:
-                        self.on_angle_change([0] * 64)
-                    if hasattr(self, 'on_detection_change') and self.on_detection_change:
-                        self.on_detection_change([0] * 64)
+                    if on_angle_change:
+                        on_angle_change([0] * 64)
+                    if on_detection_change:
+                        on_detection_change([0] * 64)
                         
             except Exception as e:
                 logger.error(f"Segmentation error: {e}")
@@ -471,19 +479,27 @@ class CameraPanel(tk.Frame):
             while not self._frame_queue.empty():
                 try:
                     frame = self._frame_queue.get_nowait()
-                except:
+                except queue.Empty:
                     break
             
             if frame is not None:
+                h, w = frame.shape[:2]
+                
                 # Overlay segmentation mask as translucent cyan highlight
                 seg_mask = self._last_seg_mask
                 if seg_mask is not None:
                     try:
-                        h, w = frame.shape[:2]
-                        mask_resized = cv2.resize(seg_mask, (w, h), interpolation=cv2.INTER_NEAREST)
+                        # Segmentation runs slower than the display: only resize
+                        # and threshold a mask the first time it is shown
+                        cache = self._overlay_cache
+                        if cache is not None and cache[0] is seg_mask and cache[1] == (w, h):
+                            body_pixels = cache[2]
+                        else:
+                            mask_resized = cv2.resize(seg_mask, (w, h), interpolation=cv2.INTER_NEAREST)
+                            body_pixels = mask_resized > 50
+                            self._overlay_cache = (seg_mask, (w, h), body_pixels)
                         # Create cyan overlay where body is detected
                         overlay = frame.copy()
-                        body_pixels = mask_resized > 50
                         overlay[body_pixels] = (
                             overlay[body_pixels] * 0.6 + 
                             np.array([180, 60, 0], dtype=np.uint8) * 0.4  # Cyan tint (BGR)
@@ -497,7 +513,6 @@ class CameraPanel(tk.Frame):
                     cv2.putText(frame, "BODY", (10, 20),
                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
                 
-                self._render_frame(frame)
                 self._update_tracking_ui_fast(self.body_detected)
                 
                 # External callback for LED processing
@@ -516,6 +531,8 @@ class CameraPanel(tk.Frame):
                         pts = np.array([[int(p[0]*w), int(p[1]*h)] for p in self._calib_points])
                         cv2.polylines(frame, [pts], True, (0, 255, 255), 2)
                 
+                # Render once, after every overlay (was also rendered before the
+                # calibration points, doubling resize + PhotoImage per frame)
                 self._render_frame(frame)
         
         except Exception as e:
@@ -582,7 +599,7 @@ class CameraPanel(tk.Frame):
             else:
                 self.tracking_status.config(text="● Tracking: SEARCHING", fg=COLORS['warning'])
                 self.position_label.config(text="Position: --")
-        except:
+        except tk.TclError:
             pass
     
     def _update_tracking_ui(self):
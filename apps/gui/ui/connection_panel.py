@@ -16,6 +16,9 @@ from core.config import (
     ESP32_S3_IDENTIFIERS
 )
 
+# (vid, pid) pairs as a set: one hash lookup per port instead of a list scan
+ESP32_USB_IDS = frozenset(ESP32_S3_IDENTIFIERS)
+
 class ConnectionPanel(tk.Frame):
     """ESP32-S3 connection panel with firmware flashing"""
     def __init__(self, parent, on_connect=None, on_disconnect=None, main_log=None, **kwargs):
@@ -230,18 +233,18 @@ class ConnectionPanel(tk.Frame):
         self.connect_btn._draw()
 
     def _check_firmware(self):
-        """Check if firmware files exist"""
-        if os.path.exists(FIRMWARE_BIN_ESP32S3):
-            size_kb = os.path.getsize(FIRMWARE_BIN_ESP32S3) / 1024
-            self.fw_status.config(text=f"✓ esp32s3 firmware.bin ({size_kb:.0f}KB)", fg=COLORS['success'])
-            self.flash_btn.set_enabled(True)
-        elif os.path.exists(FIRMWARE_BIN_ESP32):
-            size_kb = os.path.getsize(FIRMWARE_BIN_ESP32) / 1024
-            self.fw_status.config(text=f"✓ esp32 firmware.bin ({size_kb:.0f}KB)", fg=COLORS['success'])
+        """Check if firmware files exist (S3 build preferred)"""
+        for chip, path in (('esp32s3', FIRMWARE_BIN_ESP32S3), ('esp32', FIRMWARE_BIN_ESP32)):
+            # One stat per candidate answers both "exists?" and "how big?"
+            try:
+                size_kb = os.stat(path).st_size / 1024
+            except OSError:
+                continue
+            self.fw_status.config(text=f"✓ {chip} firmware.bin ({size_kb:.0f}KB)", fg=COLORS['success'])
             self.flash_btn.set_enabled(True)
-        else:
-            self.fw_status.config(text="✗ firmware.bin not found (esp32/esp32s3)", fg=COLORS['error'])
-            self.flash_btn.set_enabled(False)
+            return
+        self.fw_status.config(text="✗ firmware.bin not found (esp32/esp32s3)", fg=COLORS['error'])
+        self.flash_btn.set_enabled(False)
 
     def _draw_status_dot(self, connected):
         self.status_indicator.delete('all')
@@ -256,7 +259,7 @@ class ConnectionPanel(tk.Frame):
             try:
                 # Get current ports
                 current_ports = serial.tools.list_ports.comports()
-                current_port_names = [p.device for p in current_ports]
+                current_port_names = {p.device for p in current_ports}
                 
                 # 1. Check if connected port still exists (Auto-disconnect)
                 if self.connected and self.serial_port:
@@ -268,7 +271,8 @@ class ConnectionPanel(tk.Frame):
                 if len(current_ports) != last_port_count:
                     # Only refresh if dropdown is not open/active? 
                     # Hard to detect, but safe to update 'values'
-                    self.after(0, self._refresh_ports)
+                    # Hand over this scan so the refresh doesn't enumerate again
+                    self.after(0, lambda ports=current_ports: self._refresh_ports(ports))
                     last_port_count = len(current_ports)
                 
             except Exception as e:
@@ -316,7 +320,7 @@ class ConnectionPanel(tk.Frame):
                 if self.serial_port.port == port:
                     self._disconnect()
                     time.sleep(0.3)
-            except:
+            except (serial.SerialException, OSError):
                 pass
         
         # Confirm
@@ -361,27 +365,30 @@ class ConnectionPanel(tk.Frame):
                 self._log_flash("esptool: installed ✓")
             except ImportError:
                 self._log_flash("Installing esptool...")
-                subprocess.run([sys.executable, '-m', 'pip', 'install', 'esptool', '-q'], capture_output=True)
+                # Output is never read: discard it instead of buffering it all
+                subprocess.run([sys.executable, '-m', 'pip', 'install', 'esptool', '-q'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             # AUTO-DETECT chip type using esptool
             self._log_flash("Auto-detecting chip type...")
             detect_cmd = esptool_cmd + ['--port', port, 'chip_id']
             self._log_flash(f"Running: {' '.join(detect_cmd)}")
             
-            detect_result = subprocess.run(detect_cmd, capture_output=True, text=True, timeout=30)
-            detect_output = detect_result.stdout + detect_result.stderr
+            # stderr merged into stdout: one pipe, lines in the order esptool wrote them
+            detect_result = subprocess.run(detect_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                           text=True, timeout=30)
+            detect_output = detect_result.stdout
             self._log_flash(f"Chip detect output:")
-            for line in detect_output.split('\n'):
-                if line.strip():
-                    self._log_flash(f"  {line.strip()}")
+            self._log_flash_lines([f"  {line.strip()}" for line in detect_output.split('\n') if line.strip()])
             
             # Parse chip type from detection
             chip_type = 'esp32'  # Default
+            detect_lower = detect_output.lower()  # Lowercased once for all checks
             
-            if 'esp32-s3' in detect_output.lower() or 'esp32s3' in detect_output.lower():
+            if 'esp32-s3' in detect_lower or 'esp32s3' in detect_lower:
                 chip_type = 'esp32s3'
                 self._log_flash("✓ Detected: ESP32-S3")
-            elif 'esp32' in detect_output.lower():
+            elif 'esp32' in detect_lower:
                 chip_type = 'esp32'
                 self._log_flash("✓ Detected: ESP32 (regular)")
             else:
@@ -481,20 +488,27 @@ class ConnectionPanel(tk.Frame):
     
     def _log_flash(self, text):
         """Log to flash output and main system log (thread-safe)"""
+        self._log_flash_lines([text])
+
+    def _log_flash_lines(self, lines):
+        """Log several lines with one Tk callback and one text-widget insert"""
+        if not lines:
+            return
         def _do_log():
             try:
                 self.flash_log.config(state='normal')
-                self.flash_log.insert('end', text + '\n')
+                self.flash_log.insert('end', '\n'.join(lines) + '\n')
                 self.flash_log.see('end')
                 self.flash_log.config(state='disabled')
             except Exception:
                 pass
+            if self.main_log:
+                for line in lines:
+                    self.main_log(f"[FLASH] {line}")
         try:
             self.after(0, _do_log)
-            if self.main_log:
-                self.after(0, lambda: self.main_log(f"[FLASH] {text}"))
         except Exception:
-            print(f"[FLASH] {text}")
+            print("\n".join(f"[FLASH] {line}" for line in lines))
     
     def _flash_complete(self):
         """Clean up after flash"""
@@ -512,19 +526,15 @@ class ConnectionPanel(tk.Frame):
         self.flash_log.delete('1.0', 'end')
         self.flash_log.config(state='disabled')
     
-    def _refresh_ports(self):
-        ports = list(serial.tools.list_ports.comports())
+    def _refresh_ports(self, ports=None):
+        """Rebuild the port dropdown; ports = an existing comports() scan, if any"""
+        if ports is None:
+            ports = serial.tools.list_ports.comports()
         port_list = []
         
         for p in ports:
             port_info = p.device
-            is_esp = False
-            
-            if p.vid and p.pid:
-                for vid, pid in ESP32_S3_IDENTIFIERS:
-                    if p.vid == vid and p.pid == pid:
-                        is_esp = True
-                        break
+            is_esp = (p.vid, p.pid) in ESP32_USB_IDS
             
             desc = f"{port_info}"
             if is_esp:
@@ -1,10 +1,16 @@
 import tkinter as tk
 from tkinter import ttk
+import functools
 import numpy as np
 import cv2
 import threading
 from .theme import COLORS
 from .widgets import ModernButton
+from packages.mirror_core.utils.timing import pace
+
+# Shared read-only "all LEDs off" frame, so clearing the wall never allocates
+CLEAR_FRAME = np.zeros((64, 32), dtype=np.uint8)
+CLEAR_FRAME.setflags(write=False)
 
 class LEDControlPanel(tk.Frame):
     """Control panel for LED patterns and test modes"""
@@ -141,6 +147,7 @@ class LEDControlPanel(tk.Frame):
         In normal mode: loops forever at 5s intervals.
         """
         import time
+        steps = _sequential_steps()  # Frames built once, not every 5 s
         step = 1
         one_pass_done = False
         
@@ -149,36 +156,9 @@ class LEDControlPanel(tk.Frame):
             if self.capture_mode and one_pass_done:
                 break
             
-            frame = np.zeros((64, 32), dtype=np.uint8)
-            step_name = None
+            step_name, message, frame = steps[step - 1]
+            if self.main_log: self.main_log(message)
             
-            if step <= 4:
-                # Pairs (Rows): 1+2, 3+4, 5+6, 7+8
-                row_idx = step - 1
-                y1, y2 = row_idx * 16, (row_idx + 1) * 16
-                p1, p2 = step*2 - 1, step*2
-                
-                # Highlight Row
-                frame[y1:y2, 0:32] = 160
-                
-                # Draw Downward Arrow in the row
-                cv2.line(frame, (16, y1+2), (16, y2-4), 255, 2)
-                cv2.line(frame, (16, y2-4), (10, y2-8), 255, 2)
-                cv2.line(frame, (16, y2-4), (22, y2-8), 255, 2)
-                
-                # Label Panels
-                cv2.putText(frame, str(p1), (4, y1+12), cv2.FONT_HERSHEY_SIMPLEX, 0.4, 255, 1)
-                cv2.putText(frame, str(p2), (24, y1+12), cv2.FONT_HERSHEY_SIMPLEX, 0.4, 255, 1)
-                
-                step_name = f"Panels_{p1}_{p2}"
-                if self.main_log: self.main_log(f"Testing Row {step} (Panels {p1} & {p2}) - Arrow DOWN")
-            else:
-                # All panels
-                frame.fill(255)
-                cv2.putText(frame, "ALL OK", (4, 36), cv2.FONT_HERSHEY_SIMPLEX, 0.4, 0, 1)
-                step_name = "All_Panels"
-                if self.main_log: self.main_log("Testing ALL Panels")
-
             # 1. SEND the pattern to hardware first
             if self.on_frame_generated:
                 self.on_frame_generated(frame)
@@ -231,6 +211,7 @@ class LEDControlPanel(tk.Frame):
         self.scroll_active = False
 
     def _scroll_loop(self):
+        import time
         pos = 0
         text = self.scroll_text_var.get()
         font = cv2.FONT_HERSHEY_SIMPLEX
@@ -241,66 +222,107 @@ class LEDControlPanel(tk.Frame):
         canvas = np.zeros((64, full_w), dtype=np.uint8)
         cv2.putText(canvas, text, (width, 32 + th//2), font, 0.5, 255, 1)
         
+        # Fixed 50 ms cadence: frame prep + send happen inside the period
+        # instead of being added on top of it
+        interval = 0.05
+        next_t = time.perf_counter()
+        
+        # One reusable frame; the canvas carries `width` columns of padding
+        # on both sides so every window is full width (no per-frame pad alloc)
+        frame = np.empty((64, width), dtype=np.uint8)
+        
         while self.scroll_active and self.test_mode:
             offset = pos % (tw + width)
-            frame = canvas[:, offset:offset+width]
-            
-            # Pad if needed
-            if frame.shape[1] < width:
-                padded = np.zeros((64, width), dtype=np.uint8)
-                padded[:, :frame.shape[1]] = frame
-                frame = padded
+            np.copyto(frame, canvas[:, offset:offset+width])
             
             if self.on_frame_generated:
                 self.on_frame_generated(frame)
             
             pos += 1
-            import time
-            time.sleep(0.05)
+            next_t = pace(next_t, interval)
             
     def _generate_pattern(self, name):
+        if name == 'reset':
+            return CLEAR_FRAME # All zeros
+        return _static_pattern(name)
+
+
+@functools.lru_cache(maxsize=16)
+def _static_pattern(name):
+    """Build a static test pattern once; later requests reuse the frozen frame."""
+    frame = np.zeros((64, 32), dtype=np.uint8)
+    
+    if name == 'grid':
+        frame[0::16, :] = 255
+        frame[:, 0::16] = 255
+        frame[-1, :] = 255
+        frame[:, -1] = 255
+    elif name == 'checker':
+        ys, xs = np.ogrid[:64, :32]
+        frame[((xs//4) + (ys//4)) % 2 == 0] = 255
+    elif name == 'corners':
+        frame[0:2, 0:2] = 255
+        frame[0:2, -2:] = 255
+        frame[-2:, 0:2] = 255
+        frame[-2:, -2:] = 255
+    elif name == 'panels':
+        # Draw panel numbers
+        panels = [(1, 4, 12), (2, 18, 12), (3, 4, 28), (4, 18, 28),
+                  (5, 4, 44), (6, 18, 44), (7, 4, 60), (8, 18, 60)]
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        for num, x, y in panels:
+            cv2.putText(frame, str(num), (x, y), font, 0.7, 255, 2)
+    elif name == 'calib_white':
+        frame[:, :] = 255  # All LEDs full brightness
+    elif name.startswith('arrow'):
+        cx, cy = 16, 32
+        if 'up' in name:
+            pts = np.array([[cx, cy-10], [cx-8, cy+5], [cx+8, cy+5]])
+            cv2.fillPoly(frame, [pts], 255)
+        elif 'down' in name:
+            pts = np.array([[cx, cy+10], [cx-8, cy-5], [cx+8, cy-5]])
+            cv2.fillPoly(frame, [pts], 255)
+        elif 'left' in name:
+            pts = np.array([[cx-10, cy], [cx+5, cy-8], [cx+5, cy+8]])
+            cv2.fillPoly(frame, [pts], 255)
+        elif 'right' in name:
+            pts = np.array([[cx+10, cy], [cx-5, cy-8], [cx-5, cy+8]])
+            cv2.fillPoly(frame, [pts], 255)
+
+    frame.setflags(write=False)
+    return frame
+
+
+@functools.lru_cache(maxsize=1)
+def _sequential_steps():
+    """(step_name, log message, frozen frame) for each of the 5 sequential test steps."""
+    steps = []
+    for step in range(1, 5):
+        # Pairs (Rows): 1+2, 3+4, 5+6, 7+8
         frame = np.zeros((64, 32), dtype=np.uint8)
+        row_idx = step - 1
+        y1, y2 = row_idx * 16, (row_idx + 1) * 16
+        p1, p2 = step*2 - 1, step*2
         
-        if name == 'reset':
-            return frame # All zeros
+        # Highlight Row
+        frame[y1:y2, 0:32] = 160
         
-        if name == 'grid':
-            frame[0::16, :] = 255
-            frame[:, 0::16] = 255
-            frame[-1, :] = 255
-            frame[:, -1] = 255
-        elif name == 'checker':
-            for y in range(0, 64, 4):
-                for x in range(0, 32, 4):
-                    if ((x//4) + (y//4)) % 2 == 0:
-                        frame[y:y+4, x:x+4] = 255
-        elif name == 'corners':
-            frame[0:2, 0:2] = 255
-            frame[0:2, -2:] = 255
-            frame[-2:, 0:2] = 255
-            frame[-2:, -2:] = 255
-        elif name == 'panels':
-            # Draw panel numbers
-            panels = [(1, 4, 12), (2, 18, 12), (3, 4, 28), (4, 18, 28),
-                      (5, 4, 44), (6, 18, 44), (7, 4, 60), (8, 18, 60)]
-            font = cv2.FONT_HERSHEY_SIMPLEX
-            for num, x, y in panels:
-                cv2.putText(frame, str(num), (x, y), font, 0.7, 255, 2)
-        elif name == 'calib_white':
-            frame[:, :] = 255  # All LEDs full brightness
-        elif name.startswith('arrow'):
-            cx, cy = 16, 32
-            if 'up' in name:
-                pts = np.array([[cx, cy-10], [cx-8, cy+5], [cx+8, cy+5]])
-                cv2.fillPoly(frame, [pts], 255)
-            elif 'down' in name:
-                pts = np.array([[cx, cy+10], [cx-8, cy-5], [cx+8, cy-5]])
-                cv2.fillPoly(frame, [pts], 255)
-            elif 'left' in name:
-                pts = np.array([[cx-10, cy], [cx+5, cy-8], [cx+5, cy+8]])
-                cv2.fillPoly(frame, [pts], 255)
-            elif 'right' in name:
-                pts = np.array([[cx+10, cy], [cx-5, cy-8], [cx-5, cy+8]])
-                cv2.fillPoly(frame, [pts], 255)
-
-        return frame
+        # Draw Downward Arrow in the row
+        cv2.line(frame, (16, y1+2), (16, y2-4), 255, 2)
+        cv2.line(frame, (16, y2-4), (10, y2-8), 255, 2)
+        cv2.line(frame, (16, y2-4), (22, y2-8), 255, 2)
+        
+        # Label Panels
+        cv2.putText(frame, str(p1), (4, y1+12), cv2.FONT_HERSHEY_SIMPLEX, 0.4, 255, 1)
+        cv2.putText(frame, str(p2), (24, y1+12), cv2.FONT_HERSHEY_SIMPLEX, 0.4, 255, 1)
+        
+        frame.setflags(write=False)
+        steps.append((f"Panels_{p1}_{p2}",
+                      f"Testing Row {step} (Panels {p1} & {p2}) - Arrow DOWN", frame))
+    
+    # All panels
+    frame = np.full((64, 32), 255, dtype=np.uint8)
+    cv2.putText(frame, "ALL OK", (4, 36), cv2.FONT_HERSHEY_SIMPLEX, 0.4, 0, 1)
+    frame.setflags(write=False)
+    steps.append(("All_Panels", "Testing ALL Panels", frame))
+    return tuple(steps)
@@ -1,9 +1,25 @@
 import tkinter as tk
-import math
 import threading
 import time
+import numpy as np
 from .theme import COLORS
 from .widgets import ModernButton
+from packages.mirror_core.utils.timing import pace
+
+WAVE_FRAME_COUNT = 60
+STEP_INTERVAL = 0.05  # Seconds between animation frames
+
+
+def _build_wave_frames():
+    """All wave frames as a (frames, 64) table, built once with broadcasting."""
+    idx = np.arange(64)
+    phase = np.arange(WAVE_FRAME_COUNT)[:, None] + idx % 8 + idx // 8
+    return (np.sin(phase * 0.3) * 45 + 90).astype(int).tolist()
+
+
+# Precomputed angle lists for the wave animation (one per frame)
+WAVE_FRAMES = _build_wave_frames()
+
 
 class ManualControlPanel(tk.Frame):
     """Compact manual control panel"""
@@ -92,6 +108,8 @@ class ManualControlPanel(tk.Frame):
         """Quick ping test: Move Motor 0 to verify real-time link"""
         def run():
             self._log("Starting Ping Test...")
+            # Poses are sent one at a time on purpose: the sleeps are holds so a
+            # person can see each position (batching them would blur the motion)
             self._log("Sending: Motor 0 -> 180°")
             angles = [90] * 64
             angles[0] = 180
@@ -114,16 +132,17 @@ class ManualControlPanel(tk.Frame):
         """Scan through rows to verify driver configuration"""
         def run():
             self._log("Starting Row Scan...")
+            # One row per frame with visible holds, not one batched write:
+            # the point is to watch which driver board answers
             for row in range(8):
                 self._log(f"Scanning Row {row} (Motors {row*8}-{row*8+7})")
+                # Whole row in one frame (one slice store, one send)
                 angles = [90] * 64
-                for col in range(8):
-                    angles[row*8 + col] = 135
+                angles[row*8:row*8 + 8] = [135] * 8
                 if self.on_angle_change: self.on_angle_change(angles)
                 time.sleep(0.5)
                 
-                angles = [90] * 64
-                if self.on_angle_change: self.on_angle_change(angles)
+                if self.on_angle_change: self.on_angle_change([90] * 64)
                 time.sleep(0.2)
             
             self._log("Row Scan Complete.")
@@ -146,18 +165,12 @@ class ManualControlPanel(tk.Frame):
         threading.Thread(target=self._wave_animation, daemon=True).start()
     
     def _wave_animation(self):
-        for frame in range(60):
-            angles = []
-            for i in range(64):
-                row = i // 8
-                col = i % 8
-                wave = math.sin((frame + col + row) * 0.3) * 45 + 90
-                angles.append(int(wave))
-            
+        next_t = time.perf_counter()
+        for angles in WAVE_FRAMES:
             self.current_angles = angles
             if self.on_angle_change:
                 self.on_angle_change(angles)
-            time.sleep(0.05)
+            next_t = pace(next_t, STEP_INTERVAL)
         
         # Update UI on main thread
         self.after(0, lambda: self._set_angle(90))
@@ -182,6 +195,8 @@ class ManualControlPanel(tk.Frame):
     
     def _test_animation(self):
         """Sweep all motors continuously: 90 -> 0 -> 180 -> 90 (loop)"""
+        # Fixed-rate deadlines, so send time doesn't stretch each sweep
+        next_t = time.perf_counter()
         while hasattr(self, 'testing') and self.testing:
             # Go to 0
             for angle in range(90, -1, -5):
@@ -190,11 +205,11 @@ class ManualControlPanel(tk.Frame):
                 self.current_angles = [angle] * 64
                 if self.on_angle_change:
                     self.on_angle_change(self.current_angles)
-                time.sleep(0.05)
+                next_t = pace(next_t, STEP_INTERVAL)
             
             if not self.testing:
                 break
-            time.sleep(0.3)
+            next_t = pace(next_t, 0.3)
             
             # Go to 180
             for angle in range(0, 181, 5):
@@ -203,11 +218,11 @@ class ManualControlPanel(tk.Frame):
                 self.current_angles = [angle] * 64
                 if self.on_angle_change:
                     self.on_angle_change(self.current_angles)
-                time.sleep(0.05)
+                next_t = pace(next_t, STEP_INTERVAL)
             
             if not self.testing:
                 break
-            time.sleep(0.3)
+            next_t = pace(next_t, 0.3)
             
             # Back to 90
             for angle in range(180, 89, -5):
@@ -216,9 +231,11 @@ class ManualControlPanel(tk.Frame):
                 self.current_angles = [angle] * 64
                 if self.on_angle_change:
                     self.on_angle_change(self.current_angles)
-                time.sleep(0.05)
+                next_t = pace(next_t, STEP_INTERVAL)
             
-            time.sleep(0.3)
+            if not self.testing:
+                break
+            next_t = pace(next_t, 0.3)
         
         # Reset to center when stopped (main thread)
         self.after(0, lambda: self._set_angle(90))
@@ -2,6 +2,19 @@ import tkinter as tk
 import math
 from .theme import COLORS
 
+# Servo horn direction (cos, sin) for every whole degree 0-180, computed once
+_HORN_DIRS = [(math.cos(math.radians(180 - a)), math.sin(math.radians(180 - a)))
+              for a in range(181)]
+
+
+def _horn_dir(angle):
+    """Look up the horn direction for an angle, clamped to 0-180."""
+    return _HORN_DIRS[min(180, max(0, int(round(angle))))]
+
+
+# Brightness -> Tk fill colour for the rectangle fallback (green channel only)
+_GREEN_HEX = ['#00%02x00' % v for v in range(256)]
+
 class BodyGridVisualizer(tk.Canvas):
     """Simple 8x8 grid showing body silhouette - cells light up where body is detected"""
     def __init__(self, parent, **kwargs):
@@ -19,9 +32,9 @@ class BodyGridVisualizer(tk.Canvas):
     def update_angles(self, angles):
         """Update which cells are active based on motor angles"""
         if len(angles) >= 64:
-            for i in range(64):
-                self.motor_active[i] = angles[i] > 90
-                self.motor_angles[i] = angles[i]
+            head = list(angles[:64])
+            self.motor_angles[:] = head
+            self.motor_active[:] = [a > 90 for a in head]
         self._update_cells()
     
     def _draw_grid(self):
@@ -63,9 +76,11 @@ class BodyGridVisualizer(tk.Canvas):
             self._draw_grid()
             return
         
-        for i in range(64):
-            color = COLORS['success'] if self.motor_active[i] else '#1a1a2e'
-            self.itemconfig(self._cell_ids[i], fill=color)
+        # Bind the lookups once; this runs for every motor update
+        itemconfig = self.itemconfig
+        on_color = COLORS['success']
+        for cell_id, active in zip(self._cell_ids, self.motor_active):
+            itemconfig(cell_id, fill=on_color if active else '#1a1a2e')
 
 
 class MotorVisualizer(tk.Canvas):
@@ -76,6 +91,8 @@ class MotorVisualizer(tk.Canvas):
         self.motor_active = [False] * 64
         self._items = {}
         self._items_created = False
+        self._centers = []   # (cx, cy) per motor, fixed until the next resize
+        self._horn_len = 0
         self.bind('<Configure>', self._on_resize)
     
     def _on_resize(self, event):
@@ -106,14 +123,15 @@ class MotorVisualizer(tk.Canvas):
         start_x = (w - grid_size) / 2
         start_y = (h - grid_size) / 2
         
-        for i in range(64):
-            row = i // 8
-            col = i % 8
-            
-            cx = start_x + col * cell_size + cell_size / 2
-            cy = start_y + row * cell_size + cell_size / 2
-            
-            r = cell_size * 0.35
+        r = cell_size * 0.35
+        self._horn_len = r * 1.2
+        self._centers = [
+            (start_x + (i % 8) * cell_size + cell_size / 2,
+             start_y + (i // 8) * cell_size + cell_size / 2)
+            for i in range(64)
+        ]
+        
+        for i, (cx, cy) in enumerate(self._centers):
             active = self.motor_active[i]
             angle = self.motor_angles[i]
             
@@ -125,10 +143,9 @@ class MotorVisualizer(tk.Canvas):
             )
             
             # Horn
-            horn_len = r * 1.2
-            rad = math.radians(180 - angle)
-            ex = cx + horn_len * math.cos(rad)
-            ey = cy - horn_len * math.sin(rad)
+            dx, dy = _horn_dir(angle)
+            ex = cx + self._horn_len * dx
+            ey = cy - self._horn_len * dy
             
             horn_color = COLORS['success'] if active else '#555566'
             self._items[f'horn_{i}'] = self.create_line(
@@ -142,27 +159,9 @@ class MotorVisualizer(tk.Canvas):
             self._draw()
             return
         
-        w = self.winfo_width()
-        h = self.winfo_height()
-        
-        if w < 40 or h < 40:
-            return
-        
-        margin = 3
-        grid_size = min(w, h) - margin * 2
-        cell_size = grid_size / 8
-        
-        start_x = (w - grid_size) / 2
-        start_y = (h - grid_size) / 2
-        
-        for i in range(64):
-            row = i // 8
-            col = i % 8
-            
-            cx = start_x + col * cell_size + cell_size / 2
-            cy = start_y + row * cell_size + cell_size / 2
-            
-            r = cell_size * 0.35
+        # Geometry only changes on resize, which rebuilds it in _draw()
+        horn_len = self._horn_len
+        for i, (cx, cy) in enumerate(self._centers):
             active = self.motor_active[i]
             angle = self.motor_angles[i]
             
@@ -172,10 +171,9 @@ class MotorVisualizer(tk.Canvas):
                 self.itemconfig(self._items[f'body_{i}'], fill=body_color)
             
             # Update horn
-            horn_len = r * 1.2
-            rad = math.radians(180 - angle)
-            ex = cx + horn_len * math.cos(rad)
-            ey = cy - horn_len * math.sin(rad)
+            dx, dy = _horn_dir(angle)
+            ex = cx + horn_len * dx
+            ey = cy - horn_len * dy
             
             horn_color = COLORS['success'] if active else '#555566'
             if f'horn_{i}' in self._items:
@@ -187,6 +185,8 @@ class MotorVisualizer(tk.Canvas):
 
 class LEDSimulatorVisualizer(tk.Canvas):
     """32x64 pixel grid simulation for LED Wall"""
+    _palette = None  # (256, 3) uint8 brightness -> RGB lookup, built on first use
+
     def __init__(self, parent, width=32, height=64, pixel_size=6, **kwargs):
         super().__init__(parent, bg='black', highlightthickness=0, **kwargs)
         self.width_leds = width
@@ -221,8 +221,9 @@ class LEDSimulatorVisualizer(tk.Canvas):
             self._draw()
 
     def update_leds(self, led_data):
-        """Update display from flat list of brightness values (0-255)"""
-        if not led_data: return
+        """Update display from brightness values (0-255): a flat list or any
+        2048-element array (uint8 frames are used without copying)"""
+        if led_data is None or len(led_data) == 0: return
         
         self.delete('all')
         
@@ -230,12 +231,16 @@ class LEDSimulatorVisualizer(tk.Canvas):
             import PIL.Image, PIL.ImageTk
             import numpy as np
             
-            # Convert list to numpy array
-            arr = np.array(led_data, dtype=np.uint8).reshape((self.height_leds, self.width_leds))
+            # View (or convert) as a 2D uint8 frame
+            arr = np.asarray(led_data, dtype=np.uint8).reshape((self.height_leds, self.width_leds))
             
             # Create RGB image (Green for active, Black for inactive)
-            rgb = np.zeros((self.height_leds, self.width_leds, 3), dtype=np.uint8)
-            rgb[..., 1] = arr  # Green channel = brightness
+            palette = LEDSimulatorVisualizer._palette
+            if palette is None:
+                palette = np.zeros((256, 3), dtype=np.uint8)
+                palette[:, 1] = np.arange(256)  # Green channel = brightness
+                LEDSimulatorVisualizer._palette = palette
+            rgb = palette[arr]
             
             img = PIL.Image.fromarray(rgb)
             # Use smooth scaling to target size
@@ -258,7 +263,7 @@ class LEDSimulatorVisualizer(tk.Canvas):
                 self.create_rectangle(
                     off_x + x*px, off_y + y*px, 
                     off_x + (x+1)*px, off_y + (y+1)*px,
-                    fill=f'#00{val:02x}00', outline=''
+                    fill=_GREEN_HEX[val], outline=''
                 )
         except Exception as e:
             pass
@@ -11,6 +11,7 @@ Hardware:
 Communication: 460800 baud
 - LED Full:  0xAA 0xBB 0x01 + 2048 bytes (8-bit brightness)
 - LED 1-bit: 0xAA 0xBB 0x03 + 256 bytes  (packed 1-bit, 8x smaller!)
+- Servo delta: 0xAA 0xBB 0x08 + id + uint16 value (one servo, 6 bytes)
 - PING:      0xAA 0xBB 0x05 -> responds "PONG"
 - INFO:      0xAA 0xBB 0x06 -> responds device info
 
@@ -46,6 +47,9 @@ const char *password = WIFI_PASS;
 #define NUM_SERVOS 32       // 32 servos (2x PCA9685 boards)
 #define PCA9685_ADDR_1 0x40 // First PCA9685 (servos 0-15)
 #define PCA9685_ADDR_2 0x41 // Second PCA9685 (servos 16-31)
+#define SERVOS_PER_BOARD 16
+#define PCA9685_LED0_ON_L 0x06 // First channel register (auto-increment start)
+#define I2C_CLOCK_HZ 400000 // Fast-mode; PCA9685 also does 1 MHz (Fm+) on short wiring
 #define SERVO_FREQ 50
 #define OSC_FREQ 27000000
 
@@ -58,12 +62,14 @@ const char *password = WIFI_PASS;
 #define PACKET_LED_SIZE 2051      // Header(2) + Type(1) + Data(2048)
 #define PACKET_LED_1BIT_SIZE 259  // Header(2) + Type(1) + Data(256) - 1-bit packed
 #define PACKET_SERVO_SIZE 67      // Header(2) + Type(1) + ServoData(64) for 32 servos
+#define PACKET_SERVO_DELTA_SIZE 6 // Header(2) + Type(1) + ID(1) + Value(2)
 
 #define PKT_TYPE_LED 0x01         // Full 8-bit brightness
 #define PKT_TYPE_SERVO 0x02       // Servo angles (legacy)
 #define PKT_TYPE_LED_1BIT 0x03    // 1-bit packed LEDs (8x smaller!)
 #define PKT_TYPE_PING 0x05        // Connection test -> responds PONG
 #define PKT_TYPE_INFO 0x06        // Device info request
+#define PKT_TYPE_SERVO_DELTA 0x08 // Single servo update (id + value)
 
 // ==================== GLOBALS ====================
 CRGB leds_left[LEDS_PER_PIN];
@@ -73,6 +79,7 @@ Adafruit_PWMServoDriver pwm1 = Adafruit_PWMServoDriver(PCA9685_ADDR_1);
 Adafruit_PWMServoDriver pwm2 = Adafruit_PWMServoDriver(PCA9685_ADDR_2);
 float servoPositions[NUM_SERVOS];
 float targetPositions[NUM_SERVOS];
+uint16_t servoPWM[NUM_SERVOS]; // Last computed PWM per servo (flushed in bulk)
 
 uint8_t packetBuffer[PACKET_LED_SIZE];
 uint16_t packetIndex = 0;
@@ -104,30 +111,58 @@ uint16_t angleToPWM(float angle) {
   return map((long)angle, 0, 180, PWM_MIN, PWM_MAX);
 }
 
-void setServoAngle(uint8_t id, float angle) {
+// Smooth one servo toward its target and compute its PWM (no I2C write)
+void stepServo(uint8_t id, float angle) {
   if (id >= NUM_SERVOS)
     return;
   targetPositions[id] = angle;
   servoPositions[id] +=
       SMOOTH_ALPHA * (targetPositions[id] - servoPositions[id]);
+  servoPWM[id] = angleToPWM(servoPositions[id]);
+}
 
-  uint16_t pwm_value = angleToPWM(servoPositions[id]);
+void setServoAngle(uint8_t id, float angle) {
+  if (id >= NUM_SERVOS)
+    return;
+  stepServo(id, angle);
 
   // Route to correct PCA9685 board
   if (id < 16) {
-    pwm1.setPWM(id, 0, pwm_value); // First board: servos 0-15
+    pwm1.setPWM(id, 0, servoPWM[id]); // First board: servos 0-15
   } else {
     pwm2.setPWM(id - 16, 0,
-                pwm_value); // Second board: servos 16-31 (offset by 16)
+                servoPWM[id]); // Second board: servos 16-31 (offset by 16)
   }
 }
 
+// Write all 16 channels of one board in a single I2C transaction.
+// setPWMFreq() enables MODE1 auto-increment, so the chip walks
+// LEDn_ON_L..LEDn_OFF_H itself: 65 bytes instead of 16 setPWM() calls.
+void writeServoBoard(uint8_t addr, const uint16_t *pwm) {
+  Wire.beginTransmission(addr);
+  Wire.write(PCA9685_LED0_ON_L);
+  for (uint8_t ch = 0; ch < SERVOS_PER_BOARD; ch++) {
+    Wire.write(0); // ON_L
+    Wire.write(0); // ON_H
+    Wire.write(pwm[ch] & 0xFF);
+    Wire.write(pwm[ch] >> 8);
+  }
+  Wire.endTransmission();
+}
+
+// Push every servo's current PWM: one transaction per board
+void flushServos() {
+  writeServoBoard(PCA9685_ADDR_1, servoPWM);
+  writeServoBoard(PCA9685_ADDR_2, servoPWM + SERVOS_PER_BOARD);
+}
+
 void centerAllServos() {
   for (uint8_t i = 0; i < NUM_SERVOS; i++) {
     targetPositions[i] = 90.0;
     servoPositions[i] = 90.0;
-    setServoAngle(i, 90.0);
+    stepServo(i, 90.0);
   }
+  flushServos();
 }
 
 // ==================== WIFI ====================
@@ -254,7 +289,7 @@ void processInfo() {
   Serial.println("VERSION:2.0");
   Serial.println("LEDS:2048");
   Serial.println("SIZE:32x64");
-  Serial.println("PACKETS:01,03");
+  Serial.println("PACKETS:01,03,08");
   Serial.println("OK");
   Serial.flush();
 }
@@ -265,8 +300,21 @@ void processServoPacket() {
     for (uint8_t i = 0; i < NUM_SERVOS; i++) {
       uint16_t value = (packetBuffer[3 + i * 2] << 8) | packetBuffer[4 + i * 2];
       float angle = map(value, 0, 1000, 0, 180);
-      setServoAngle(i, angle);
+      stepServo(i, angle);
     }
+    flushServos();
+    lastServoPacket = millis();
+  }
+}
+
+// Single-servo update: only the addressed servo gets a new target
+void processServoDeltaPacket() {
+  if (packetBuffer[0] == 0xAA && packetBuffer[1] == 0xBB &&
+      packetBuffer[2] == PKT_TYPE_SERVO_DELTA) {
+    uint8_t id = packetBuffer[3];
+    uint16_t value = (packetBuffer[4] << 8) | packetBuffer[5];
+    float angle = map(value, 0, 1000, 0, 180);
+    setServoAngle(id, angle);
     lastServoPacket = millis();
   }
 }
@@ -316,6 +364,10 @@ void setup() {
   pwm2.setOscillatorFrequency(OSC_FREQ);
   pwm2.setPWMFreq(SERVO_FREQ);
 
+  // Raise the bus clock after begin() (which may re-init Wire at 100 kHz):
+  // the default rate caps how fast full servo frames reach the boards
+  Wire.setClock(I2C_CLOCK_HZ);
+
   centerAllServos();
   delay(500);
 
@@ -342,6 +394,7 @@ void setup() {
   Serial.println("  0x03 = LED 1-bit (259 bytes) - OPTIMIZED");
   Serial.println("  0x05 = PING -> PONG");
   Serial.println("  0x06 = INFO -> device info");
+  Serial.println("  0x08 = Servo delta (6 bytes)");
   Serial.println();
 
   lastFPSUpdate = millis();
@@ -383,7 +436,7 @@ void loop() {
       // Packet type
       if (inByte == PKT_TYPE_LED || inByte == PKT_TYPE_SERVO || 
           inByte == PKT_TYPE_LED_1BIT || inByte == PKT_TYPE_PING || 
-          inByte == PKT_TYPE_INFO) {
+          inByte == PKT_TYPE_INFO || inByte == PKT_TYPE_SERVO_DELTA) {
         currentPacketType = inByte;
         packetBuffer[packetIndex++] = inByte;
         
@@ -407,6 +460,7 @@ void loop() {
       uint16_t maxSize = (currentPacketType == PKT_TYPE_LED) ? PACKET_LED_SIZE
                          : (currentPacketType == PKT_TYPE_SERVO) ? PACKET_SERVO_SIZE
                          : (currentPacketType == PKT_TYPE_LED_1BIT) ? PACKET_LED_1BIT_SIZE
+                         : (currentPacketType == PKT_TYPE_SERVO_DELTA) ? PACKET_SERVO_DELTA_SIZE
                          : PACKET_LED_SIZE; // fallback largest
       if (packetIndex >= maxSize) {
         packetIndex = 0;
@@ -425,6 +479,9 @@ void loop() {
       } else if (currentPacketType == PKT_TYPE_LED_1BIT &&
                  packetIndex >= PACKET_LED_1BIT_SIZE) {
         complete = true;
+      } else if (currentPacketType == PKT_TYPE_SERVO_DELTA &&
+                 packetIndex >= PACKET_SERVO_DELTA_SIZE) {
+        complete = true;
       }
 
       if (complete) {
@@ -434,6 +491,8 @@ void loop() {
           processServoPacket();
         } else if (currentPacketType == PKT_TYPE_LED_1BIT) {
           processLED1BitPacket();
+        } else if (currentPacketType == PKT_TYPE_SERVO_DELTA) {
+          processServoDeltaPacket();
         }
         packetIndex = 0;
         currentPacketType = 0;
@@ -458,8 +517,9 @@ void loop() {
 
   // Smooth servo updates
   for (uint8_t i = 0; i < NUM_SERVOS; i++) {
-    setServoAngle(i, targetPositions[i]);
+    stepServo(i, targetPositions[i]);
   }
+  flushServos();
 
   // FPS
   if (millis() - lastFPSUpdate > 1000) {
@@ -16,6 +16,13 @@ MAPPING MODES:
 - Mode 2: Column-based pin split (left column → Pin5, right column → Pin18)
 - Mode 3: Column-based + serpentine within panels
 - Mode 4: Full custom mapping
+
+PERFORMANCE NOTE - the LED path is wire-bound, not CPU-bound:
+- Full frame (0x01): 2051 bytes x 10 bits / 460800 baud = ~44 ms on the wire
+- 1-bit frame (0x03): 259 bytes = ~5.6 ms on the wire
+- Remap + pack in NumPy: well under 1 ms for a 2 KB frame
+Optimize the wire first (baud rate, 1-bit/RLE packets, fewer redundant
+frames) before reaching for JIT/SIMD on these tiny arrays.
 """
 
 import numpy as np
@@ -27,6 +34,45 @@ except ImportError:
     # Fallback if utils not found (e.g. running standalone)
     def crc16_ccitt(data): return 0
 
+# Packet headers: sync bytes 0xAA 0xBB + packet type (built once, not per frame)
+SYNC_BYTES = b'\xAA\xBB'
+HEADER_LED = SYNC_BYTES + b'\x01'       # Full 8-bit brightness
+HEADER_LED_1BIT = SYNC_BYTES + b'\x03'  # 1-bit packed
+HEADER_LED_RLE = SYNC_BYTES + b'\x04'   # Run-length encoded
+
+
+def _pack_bits(binary, num_bytes=256):
+    """Pack a 0/1 frame into num_bytes bytes, 8 pixels per byte, MSB first.
+    Pixels beyond num_bytes * 8 are dropped; a short frame is zero padded."""
+    bits = np.packbits(binary.reshape(-1)[:num_bytes * 8])
+    packed = bytearray(num_bytes)
+    packed[:bits.size] = bits.tobytes()
+    return packed
+
+
+# Parsed led_mapping.json per path as (mtime, mapping): every controller in a
+# session reuses one parse until calibration rewrites the file
+_MAPPING_FILE_CACHE = {}
+
+
+def _read_mapping_file(mapping_path):
+    """Return {logical_panel: physical_pos} from a mapping file, or None if it
+    has no "mapping" key. Re-reads only when the file's mtime changes."""
+    import json
+    
+    mtime = mapping_path.stat().st_mtime
+    cached = _MAPPING_FILE_CACHE.get(mapping_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with open(mapping_path, 'r') as f:
+        config = json.load(f)
+    mapping = None
+    if "mapping" in config:
+        mapping = {int(k): v for k, v in config["mapping"].items()}
+    _MAPPING_FILE_CACHE[mapping_path] = (mtime, mapping)
+    return mapping
+
 
 class LEDController:
     # Panel configuration
@@ -64,6 +110,10 @@ class LEDController:
         self.left_pin_panels = [1, 3, 5, 7]   # Panels on GPIO 5
         self.right_pin_panels = [2, 4, 6, 8]  # Panels on GPIO 18
         
+        # Precomputed remap tables (column-split gather indices, auto-calibrated
+        # panel slices), keyed by layout
+        self._remap_index_cache = {}
+        
         # Auto-detected mapping (loaded from file if exists)
         self.panel_mapping = None
         self._load_calibration_mapping()
@@ -77,7 +127,6 @@ class LEDController:
     
     def _load_calibration_mapping(self):
         """Load auto-calibrated mapping from JSON file if it exists."""
-        import json
         from pathlib import Path
         
         # Look for mapping file in data directory
@@ -89,13 +138,10 @@ class LEDController:
         for mapping_path in possible_paths:
             if mapping_path.exists():
                 try:
-                    with open(mapping_path, 'r') as f:
-                        config = json.load(f)
+                    mapping = _read_mapping_file(mapping_path)
                     
-                    if "mapping" in config:
-                        self.panel_mapping = {
-                            int(k): v for k, v in config["mapping"].items()
-                        }
+                    if mapping is not None:
+                        self.panel_mapping = dict(mapping)  # Own copy per controller
                         print(f"[LEDController] Loaded calibration from {mapping_path}")
                         print(f"[LEDController] Mapping: {self.panel_mapping}")
                         return
@@ -188,6 +234,19 @@ class LEDController:
         """
         output = np.zeros_like(frame)
         
+        for dst, src in self._auto_calibrated_slices():
+            output[dst] = frame[src]
+        
+        return output
+    
+    def _auto_calibrated_slices(self):
+        """Return cached (dst, src) panel slice pairs for the current panel_mapping."""
+        key = ('auto', tuple(sorted(self.panel_mapping.items())))
+        pairs = self._remap_index_cache.get(key)
+        if pairs is not None:
+            return pairs
+        
+        pairs = []
         for logical_panel in range(1, 9):
             physical_pos = self.panel_mapping.get(logical_panel, logical_panel)
             
@@ -203,10 +262,11 @@ class LEDController:
             dst_y = dst_row * 16
             dst_x = dst_col * 16
             
-            # Copy panel
-            output[dst_y:dst_y+16, dst_x:dst_x+16] = frame[src_y:src_y+16, src_x:src_x+16]
+            pairs.append(((slice(dst_y, dst_y+16), slice(dst_x, dst_x+16)),
+                          (slice(src_y, src_y+16), slice(src_x, src_x+16))))
         
-        return output
+        self._remap_index_cache[key] = pairs
+        return pairs
     
     def _remap_column_split(self, frame, serpentine=True):
         """
@@ -233,48 +293,63 @@ class LEDController:
         Output layout (rows 32-63 = right column):
           Same structure for right_pin_panels.
         """
-        output = np.zeros((self.height, self.width), dtype=np.uint8)
+        index, uncovered = self._column_split_index(serpentine)
+        
+        # One vectorized gather instead of a per-pixel Python loop
+        flat = frame.reshape(-1)
+        output = flat[index].astype(np.uint8, copy=False).reshape(self.height, self.width)
+        if uncovered is not None:
+            output[uncovered] = 0
+        return output
+    
+    def _column_split_index(self, serpentine):
+        """
+        Build (once per panel layout) the flat source index for every output
+        pixel of _remap_column_split. Returns (index, uncovered) where
+        uncovered is a mask of output pixels no panel maps to, or None.
+        """
+        key = (serpentine, tuple(self.left_pin_panels), tuple(self.right_pin_panels))
+        cached = self._remap_index_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        index = np.full((self.height, self.width), -1, dtype=np.intp)
+        local_y, local_x = np.ogrid[0:self.PANEL_HEIGHT, 0:self.PANEL_WIDTH]
+        
+        # Even physical rows go to the left half (x=0-15), odd rows to the
+        # right half (x=16-31); with serpentine, odd rows are also reversed
+        x_offset = (local_y % 2) * 16
+        if serpentine:
+            dst_x = x_offset + np.where(local_y & 1, self.PANEL_WIDTH - 1 - local_x, local_x)
+        else:
+            dst_x = x_offset + local_x
         
         def pack_column(pin_panels, output_row_offset):
             """Pack 4 panels (64×16 physical) into 32 output rows (32 wide each)."""
             for panel_idx, panel_num in enumerate(pin_panels):
                 # Source: where this panel lives in the logical frame
-                src_row = (panel_num - 1) // 2  # Panel row (0-3)
-                src_col = (panel_num - 1) % 2   # Panel col (0=left, 1=right)
-                src_y_start = src_row * self.PANEL_HEIGHT
-                src_x_start = src_col * self.PANEL_WIDTH
+                src_y = (panel_num - 1) // 2 * self.PANEL_HEIGHT + local_y
+                src_x = (panel_num - 1) % 2 * self.PANEL_WIDTH + local_x
                 
-                # Each panel has 16 physical rows of 16 pixels.
-                # Two physical rows pack into one 32-wide output row.
-                # So 16 physical rows → 8 output rows per panel.
-                for local_y in range(self.PANEL_HEIGHT):
-                    # Which output row does this physical row go to?
-                    # panel_idx * 8 = base output row for this panel
-                    # local_y // 2 = which pair of physical rows
-                    dst_row = output_row_offset + panel_idx * 8 + (local_y // 2)
-                    
-                    # Even physical rows go to left half (x=0-15)
-                    # Odd physical rows go to right half (x=16-31) 
-                    x_offset = 0 if (local_y % 2 == 0) else 16
-                    
-                    for local_x in range(self.PANEL_WIDTH):
-                        src_y = src_y_start + local_y
-                        src_x = src_x_start + local_x
-                        
-                        # Apply serpentine within panel if needed
-                        if serpentine and (local_y & 1):  # Odd rows reversed
-                            dst_x = x_offset + (self.PANEL_WIDTH - 1 - local_x)
-                        else:
-                            dst_x = x_offset + local_x
-                        
-                        output[dst_row, dst_x] = frame[src_y, src_x]
+                # Two physical rows pack into one 32-wide output row,
+                # so 16 physical rows → 8 output rows per panel
+                dst_row = output_row_offset + panel_idx * 8 + (local_y // 2)
+                index[dst_row, dst_x] = src_y * self.width + src_x
         
         # Left column panels → output rows 0-31
         pack_column(self.left_pin_panels, 0)
         # Right column panels → output rows 32-63  
         pack_column(self.right_pin_panels, 32)
         
-        return output
+        uncovered = index < 0
+        if uncovered.any():
+            index[uncovered] = 0
+        else:
+            uncovered = None
+        
+        cached = (index.reshape(-1), uncovered)
+        self._remap_index_cache[key] = cached
+        return cached
     
     def _remap_full_custom(self, frame):
         """
@@ -322,18 +397,26 @@ class LEDController:
     def _render_landmarks(self, led_frame, pose_results):
         """Helper to render landmarks when mask fails"""
         h, w = self.height, self.width
-        for landmark in pose_results.pose_landmarks.landmark:
-            if landmark.visibility > 0.6:  # Lowered threshold slightly
-                x = int(landmark.x * w)
-                y = int(landmark.y * h)
-                # Expand to 3x3 dot for visibility
-                if 0 <= x < w and 0 <= y < h:
-                    led_frame[y, x] = [255, 255, 255]
-                    # Draw minimal cross pattern
-                    if x > 0: led_frame[y, x-1] = [100, 100, 100]
-                    if x < w-1: led_frame[y, x+1] = [100, 100, 100]
-                    if y > 0: led_frame[y-1, x] = [100, 100, 100]
-                    if y < h-1: led_frame[y+1, x] = [100, 100, 100]
+        points = [(lm.x, lm.y) for lm in pose_results.pose_landmarks.landmark
+                  if lm.visibility > 0.6]  # Lowered threshold slightly
+        if not points:
+            return
+        
+        coords = np.array(points)
+        xs = (coords[:, 0] * w).astype(np.intp)
+        ys = (coords[:, 1] * h).astype(np.intp)
+        
+        # Drop off-screen landmarks with one mask instead of a branch per point
+        visible = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+        xs, ys = xs[visible], ys[visible]
+        
+        # Minimal cross pattern around each point, drawn before the centers
+        # so overlapping crosses never dim another landmark's 3x3 dot center
+        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nx, ny = xs + dx, ys + dy
+            inside = (nx >= 0) & (nx < w) & (ny >= 0) & (ny < h)
+            led_frame[ny[inside], nx[inside]] = 100
+        led_frame[ys, xs] = 255
 
     def pack_led_packet(self, led_frame):
         """
@@ -350,18 +433,20 @@ class LEDController:
         else:
             brightness = led_frame
 
-        brightness = np.clip(brightness, 0, 255).astype(np.uint8)
+        # uint8 input is already in range - skip the clip/astype copies
+        # (also keeps broadcast views such as np.broadcast_to zero-copy)
+        if brightness.dtype != np.uint8:
+            brightness = np.clip(brightness, 0, 255).astype(np.uint8)
         
         # Apply hardware mapping before transmission
         brightness = self.remap_for_hardware(brightness)
 
-        # Fast path: use numpy tobytes() instead of Python list iteration
-        flat = brightness.flatten()
-        if flat.size != self.width * self.height:
+        if brightness.size != self.width * self.height:
             raise ValueError("LED frame does not contain expected number of pixels")
 
-        header = b'\xAA\xBB\x01'
-        return header + flat.tobytes()
+        # Fast path: tobytes() is the only full-frame copy (flatten() used to add
+        # another); ascontiguousarray only materializes strided views (flips)
+        return HEADER_LED + np.ascontiguousarray(brightness).tobytes()
 
     def pack_led_packet_1bit(self, led_frame, threshold=128):
         """
@@ -387,20 +472,13 @@ class LEDController:
         brightness = self.remap_for_hardware(brightness)
         
         # Threshold to binary
-        binary = (brightness > threshold).astype(np.uint8)
-        flat = binary.flatten()
-        
-        # Pack 8 pixels per byte
-        packed = []
-        for i in range(0, len(flat), 8):
-            byte_val = 0
-            for bit in range(8):
-                if i + bit < len(flat) and flat[i + bit]:
-                    byte_val |= (1 << (7 - bit))
-            packed.append(byte_val)
+        binary = brightness > threshold
+        
+        # Pack 8 pixels per byte (MSB first) in one C pass
+        packed = np.packbits(binary.reshape(-1))
         
         # Header: 0xAA 0xBB 0x03 (0x03 = 1-bit mode)
-        packet = bytes([0xAA, 0xBB, 0x03]) + bytes(packed)
+        packet = HEADER_LED_1BIT + packed.tobytes()
         return packet
 
     def pack_led_packet_rle(self, led_frame, threshold=128):
@@ -429,22 +507,24 @@ class LEDController:
         
         # Threshold to binary (0 or 255)
         binary = ((brightness > threshold).astype(np.uint8)) * 255
-        flat = binary.flatten()
-        
-        # RLE encode
-        rle = []
-        i = 0
-        while i < len(flat):
-            val = flat[i]
-            count = 0
-            while i < len(flat) and flat[i] == val and count < 255:
-                count += 1
-                i += 1
-            rle.extend([count, val])
+        flat = binary.ravel()
+        
+        # RLE encode: run boundaries are where the value changes
+        starts = np.concatenate(([0], np.flatnonzero(flat[1:] != flat[:-1]) + 1))
+        lengths = np.diff(np.append(starts, flat.size))
+        
+        # Runs longer than 255 split into full 255 chunks plus a remainder
+        chunks = (lengths + 254) // 255
+        counts = np.full(int(chunks.sum()), 255, dtype=np.uint8)
+        counts[np.cumsum(chunks) - 1] = lengths - 255 * (chunks - 1)
+        
+        rle = np.empty(counts.size * 2, dtype=np.uint8)
+        rle[0::2] = counts
+        rle[1::2] = np.repeat(flat[starts], chunks)
         
         # Header: 0xAA 0xBB 0x04 length(2 bytes) data...
-        rle_len = len(rle)
-        packet = bytes([0xAA, 0xBB, 0x04, (rle_len >> 8) & 0xFF, rle_len & 0xFF]) + bytes(rle)
+        rle_len = rle.size
+        packet = HEADER_LED_RLE + bytes([(rle_len >> 8) & 0xFF, rle_len & 0xFF]) + rle.tobytes()
         return packet
 
     def pack_led_packet_1bit_crc(self, led_frame, frame_id: int):
@@ -462,25 +542,10 @@ class LEDController:
              led_frame = cv2.resize(led_frame, (self.width, self.height), interpolation=cv2.INTER_NEAREST)
 
         # Threshold to binary
-        binary = (led_frame > 128).astype(np.uint8)
-        flat = binary.flatten()
-        
-        # Pack 8 pixels per byte
-        packed = bytearray(256)
-        # Fast packing using numpy
-        # Reshape to (256, 8)
-        # bit_weights = np.array([128, 64, 32, 16, 8, 4, 2, 1], dtype=np.uint8)
-        # This is getting complex to vectorise correctly with simple numpy without lookups
-        # Fallback to loop for safety (it's only 256 iterations)
-        
-        byte_idx = 0
-        for i in range(0, 2048, 8):
-            byte_val = 0
-            for bit in range(8):
-                if flat[i + bit]:
-                    byte_val |= (1 << (7 - bit))
-            packed[byte_idx] = byte_val
-            byte_idx += 1
+        binary = led_frame > 128
+        
+        # Pack 8 pixels per byte (MSB first)
+        packed = _pack_bits(binary)
             
         # Build payload for CRC calculation
         # Payload = Type(1) + FrameID(2) + Data(256)
@@ -494,7 +559,7 @@ class LEDController:
         payload = bytearray([type_byte, fid_hi, fid_lo]) + packed
         crc = crc16_ccitt(payload)
         
-        packet = bytearray([0xAA, 0xBB]) + payload + bytearray([(crc >> 8) & 0xFF, crc & 0xFF])
+        packet = SYNC_BYTES + payload + bytearray([(crc >> 8) & 0xFF, crc & 0xFF])
         return bytes(packet)
 
     def pack_remapped_led_packet_1bit(self, remapped_frame):
@@ -512,21 +577,11 @@ class LEDController:
             binary = (remapped_frame > 127).astype(np.uint8)
         else:
             binary = remapped_frame.astype(np.uint8)
-            
-        flat = binary.flatten()
         
         # Pack 8 pixels per byte (MSB first)
-        packed = bytearray(256)
-        byte_idx = 0
-        for i in range(0, min(len(flat), 2048), 8):
-            byte_val = 0
-            for bit in range(8):
-                if i + bit < len(flat) and flat[i + bit]:
-                    byte_val |= (1 << (7 - bit))
-            packed[byte_idx] = byte_val
-            byte_idx += 1
-        
-        return bytes([0xAA, 0xBB, 0x03]) + bytes(packed)
+        packed = _pack_bits(binary)
+        
+        return HEADER_LED_1BIT + bytes(packed)
 
     def pack_remapped_led_packet_1bit_crc(self, remapped_frame, frame_id: int):
         """
@@ -547,25 +602,10 @@ class LEDController:
                  binary = (remapped_frame > 0.5).astype(np.uint8)
         else:
             binary = remapped_frame.astype(np.uint8)
-            
-        flat = binary.flatten()
         
         # Pack 8 pixels per byte (MSB first)
         # Firmware expects 256 bytes for 2048 LEDs
-        packed = bytearray(256)
-        
-        byte_idx = 0
-        pixel_idx = 0
-        max_pixels = 2048
-        
-        while pixel_idx < max_pixels and byte_idx < 256:
-            byte_val = 0
-            for bit in range(8):
-                if pixel_idx + bit < len(flat) and flat[pixel_idx + bit]:
-                    byte_val |= (1 << (7 - bit))
-            packed[byte_idx] = byte_val
-            byte_idx += 1
-            pixel_idx += 8
+        packed = _pack_bits(binary)
             
         # Build payload for CRC calculation
         # Payload = Type(1) + FrameID(2) + Data(256)
@@ -582,7 +622,7 @@ class LEDController:
         crc = crc16_ccitt(payload)
         
         # Construct final packet: Header(2) + Payload(259) + CRC(2)
-        packet = bytearray([0xAA, 0xBB]) + payload + bytearray([(crc >> 8) & 0xFF, crc & 0xFF])
+        packet = SYNC_BYTES + payload + bytearray([(crc >> 8) & 0xFF, crc & 0xFF])
         return bytes(packet)
 
 
@@ -8,11 +8,20 @@ Handles servo angle calculations and packet packing for ESP32 control
 import numpy as np
 import struct
 
+HEADER_SERVO = b'\xAA\xBB\x02'
+HEADER_SERVO_DELTA = b'\xAA\xBB\x08'  # One servo: id + uint16 value
+
 class MotorController:
+    # Servo value (0-1000, big-endian uint16) for every whole degree 0-180
+    _ANGLE_LUT = np.trunc((np.arange(181) / 180.0) * 1000).astype('>u2')
+
     def __init__(self, num_servos=64, angle_min=0, angle_max=180):
         self.num_servos = num_servos
         self.angle_min = angle_min
         self.angle_max = angle_max
+        
+        # Ready-made packets for "all servos at one angle", keyed by clamped angle
+        self._uniform_cache = {}
 
     def calculate_angles(self, pose_results):
         """
@@ -66,24 +75,71 @@ class MotorController:
         Firmware expects:
           [0xAA, 0xBB, 0x02, servo1_hi, servo1_lo, ..., servo6_hi, servo6_lo]
         Each servo value is a uint16 representing 0-1000 (mapped to 0-180°).
-        Total length = 15 bytes.
+        Total length = 3 + 2 * num_servos bytes.
         """
         if len(angles) != self.num_servos:
             raise ValueError(f"Expected {self.num_servos} angles, got {len(angles)}")
 
-        packet = [0xAA, 0xBB, 0x02]
+        # Big-endian two bytes per servo; join reads the array's buffer
+        # directly, so the packet is built in one copy (no tobytes() temp)
+        return b''.join((HEADER_SERVO, self._angle_values(angles)))
+
+    def _angle_values(self, angles):
+        """Map a sequence of angles to big-endian 0-1000 servo values."""
+        # Normalize (truncate like int()) and clamp every angle in one pass
+        angles = np.asarray(angles)
+        if angles.dtype.kind not in 'biu':
+            angles = np.trunc(angles.astype(np.float64))
+            if not np.isfinite(angles).all():
+                raise ValueError("Servo angles must be finite")
+        angles = np.clip(angles, self.angle_min, self.angle_max)
 
-        for angle in angles:
-            # Normalize and clamp angle
-            angle = int(angle) if hasattr(angle, "item") else int(angle)
-            angle = max(self.angle_min, min(self.angle_max, angle))
+        # Whole degrees within 0-180: one table gather, already big-endian
+        if self.angle_min >= 0 and self.angle_max <= 180:
+            return self._ANGLE_LUT[angles.astype(np.intp)]
 
-            # Map 0-180 deg -> 0-1000 (matches firmware map(value, 0..1000, 0..180))
-            value = int((angle / 180.0) * 1000)
-            value = max(0, min(1000, value))
+        # Map 0-180 deg -> 0-1000 (matches firmware map(value, 0..1000, 0..180))
+        values = np.clip(np.trunc((angles / 180.0) * 1000), 0, 1000)
+        return values.astype('>u2')
+
+    def pack_uniform(self, angle):
+        """Packet with every servo at the same angle (cached per angle)."""
+        angle = max(self.angle_min, min(self.angle_max, int(angle)))
+        packet = self._uniform_cache.get(angle)
+        if packet is None:
+            # One value repeated: compute it once and repeat its two bytes
+            # (no angle list, no temporary array)
+            value = self._servo_value(angle)
+            packet = HEADER_SERVO + struct.pack('>H', value) * self.num_servos
+            self._uniform_cache[angle] = packet
+        return packet
+
+    def pack_single_override(self, base_packet, servo_id, angle):
+        """
+        Rewrite one servo's two bytes in place in a bytearray packet.
+        Use with bytearray(self.pack_uniform(90)) to move a single servo
+        without repacking the whole frame.
+        """
+        self._check_servo_id(servo_id)
+        struct.pack_into('>H', base_packet, len(HEADER_SERVO) + 2 * servo_id,
+                         self._servo_value(angle))
+        return base_packet
+
+    def pack_servo_delta(self, servo_id, angle):
+        """
+        Pack a single-servo update (6 bytes instead of a full frame).
+        Firmware expects:
+          [0xAA, 0xBB, 0x08, servo_id, value_hi, value_lo]
+        Other servos keep their last target.
+        """
+        self._check_servo_id(servo_id)
+        return HEADER_SERVO_DELTA + struct.pack('>BH', servo_id, self._servo_value(angle))
 
-            # Big-endian two bytes per servo
-            packet.append((value >> 8) & 0xFF)
-            packet.append(value & 0xFF)
+    def _check_servo_id(self, servo_id):
+        if not 0 <= servo_id < self.num_servos:
+            raise ValueError(f"Servo id must be 0-{self.num_servos - 1}")
 
-        return bytes(packet)
+    def _servo_value(self, angle):
+        """0-1000 value for one angle, same truncate/clamp rules as pack_servo_packet."""
+        angle = max(self.angle_min, min(self.angle_max, int(angle)))
+        return max(0, min(1000, int((angle / 180.0) * 1000)))
@@ -5,19 +5,78 @@ Serial Manager for Mirror Body Animations
 Handles threaded serial communication with ESP32
 """
 
+import collections
+import functools
+import re
 import serial
 import threading
 import time
 import queue
-import serial.tools.list_ports
 try:
     from ..simulation.mock_serial import MockSerial, get_virtual_device_instance
 except ImportError:
     MockSerial = None
 
+# USB (VID, PID) pairs of ESP32 native USB and common USB-UART bridges
+# (same table as the GUI's ESP32_S3_IDENTIFIERS); checked before descriptions
+ESP32_USB_IDS = frozenset([
+    (0x303A, 0x1001),  # ESP32-S3 native USB
+    (0x303A, 0x0002),  # ESP32-S3 JTAG
+    (0x10C4, 0xEA60),  # Silicon Labs CP210x
+    (0x1A86, 0x7523),  # CH340
+    (0x1A86, 0x55D4),  # CH9102
+    (0x0403, 0x6001),  # FTDI FT232
+    (0x0403, 0x6015),  # FTDI FT231X
+])
+
+# Substrings (casefolded) of USB-UART bridges commonly found on ESP32 boards
+ESP32_PORT_KEYWORDS = ("cp210", "ch340", "usb", "silicon", "uart", "esp32", "wch", "ftdi")
+# All keywords in one compiled alternation: a single scan per port string
+ESP32_PORT_PATTERN = re.compile("|".join(map(re.escape, ESP32_PORT_KEYWORDS)))
+
+
+@functools.lru_cache(maxsize=1)
+def _autodetect_port():
+    """Scan serial ports once per process and return the likely ESP32 device.
+
+    Enumerating ports is slow on Windows (~100 ms), and several managers may be
+    created in one session. Returns None when no ports are present.
+    """
+    # Deferred import: only auto-detection needs the platform port-enumeration
+    # backend (setupapi/ctypes on Windows), explicit ports and SIMULATOR skip it
+    import serial.tools.list_ports
+    ports = serial.tools.list_ports.comports()
+    if not ports:
+        return None
+
+    print("[INFO] Available serial ports:")
+    for port in ports:
+        print(f"   - {port.device}: {port.description}")
+
+    # Exact USB IDs first: one set lookup per port, and unlike descriptions
+    # they don't vary with OS language or driver version
+    for port in ports:
+        if (port.vid, port.pid) in ESP32_USB_IDS:
+            return port.device
+
+    for port in ports:
+        # One casefolded haystack per port instead of two lookups per keyword
+        ident = f"{port.description or ''} {getattr(port, 'hwid', None) or ''}".casefold()
+        if ESP32_PORT_PATTERN.search(ident):
+            return port.device
+
+    esp32_port = ports[0].device
+    print(f"[WARN] No known ESP32 bridge detected. Falling back to {esp32_port}. "
+          "Set config['led_serial_port'] to override.")
+    return esp32_port
+
+
+# Seconds to wait for READY after reset (full ESP32 boot: WiFi + servos)
+READY_TIMEOUT = 15
+
 
 class SerialManager:
-    def __init__(self, port='AUTO', baudrate=460800):
+    def __init__(self, port='AUTO', baudrate=460800, async_writes=False):
         self.port = port
         self.baudrate = baudrate
         self.ser = None  # This is what the code expects
@@ -29,9 +88,25 @@ class SerialManager:
         self.send_queue = queue.Queue()
         self.receive_thread = None
 
+        # Optional servo writer thread: send_servo() only drops the packet in a
+        # one-slot deque. Each full-frame pose supersedes the previous one, so a
+        # newer packet replaces an unsent older one (latest wins, like the GUI's
+        # LED write queue); deque append/popleft are atomic, so queueing takes no lock
+        self._servo_slot = collections.deque(maxlen=1)
+        self._servo_ready = threading.Event()
+        self._servo_thread = None
+        # One writer at a time on the port: pyserial splits a write into several
+        # os.write calls, so an unguarded servo frame from the writer thread
+        # could land inside an LED frame and break the AA BB framing
+        self._write_lock = threading.Lock()
+
         # Connect to serial port
         self.connect()
 
+        if async_writes:
+            self._servo_thread = threading.Thread(target=self._servo_writer_loop, daemon=True)
+            self._servo_thread.start()
+
         # Start communication thread - DISABLED TEMPORARILY FOR STABILITY
         # if self.connected:
         #     self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
@@ -42,28 +117,12 @@ class SerialManager:
         try:
             if self.port == 'AUTO':
                 # Auto-detect ESP32 port
-                ports = serial.tools.list_ports.comports()
-                esp32_port = None
-                if not ports:
+                esp32_port = _autodetect_port()
+                if esp32_port is None:
+                    _autodetect_port.cache_clear()  # Nothing plugged in yet - rescan next time
                     print("[ERROR] No serial ports detected - is the ESP32 connected?")
                     self.last_error = "No serial ports detected"
                     return False
-
-                print("[INFO] Available serial ports:")
-                for port in ports:
-                    print(f"   - {port.device}: {port.description}")
-
-                keywords = ("cp210", "ch340", "usb", "silicon", "uart", "esp32", "wch", "ftdi")
-                for port in ports:
-                    desc_lower = port.description.lower() if port.description else ""
-                    hwid_lower = port.hwid.lower() if getattr(port, "hwid", None) else ""
-                    if any(keyword in desc_lower or keyword in hwid_lower for keyword in keywords):
-                        esp32_port = port.device
-                        break
-                if not esp32_port:
-                    esp32_port = ports[0].device
-                    print(f"[WARN] No known ESP32 bridge detected. Falling back to {esp32_port}. "
-                          "Set config['led_serial_port'] to override.")
                 self.port = esp32_port
 
             if self.port == 'SIMULATOR':
@@ -76,8 +135,15 @@ class SerialManager:
                  return True
 
             self.ser = serial.Serial(self.port, self.baudrate, timeout=1, write_timeout=1.0)
+            # Windows only: a 64 KB driver TX queue takes a whole 2 KB LED frame
+            # in one go instead of fragmenting it into the USB stack
+            if hasattr(self.ser, 'set_buffer_size'):
+                self.ser.set_buffer_size(rx_size=4096, tx_size=1 << 16)
             
             # Force ESP32 Reset via DTR/RTS
+            # Lines are set one at a time on purpose: the auto-reset circuit
+            # pulls EN low only while RTS=1/DTR=0, a state these steps pass
+            # through. Setting both lines together would never reset the chip.
             self.ser.dtr = False
             self.ser.rts = False
             time.sleep(0.1)
@@ -92,17 +158,19 @@ class SerialManager:
 
             # Test connection by waiting for READY
             ready_received = False
-            start_time = time.time()
-            while time.time() - start_time < 15:  # Wait up to 15 seconds for full ESP32 boot (WiFi + servos)
+            # Monotonic deadline: immune to wall-clock jumps, one subtraction fewer per poll
+            clock = time.perf_counter
+            deadline = clock() + READY_TIMEOUT
+            while clock() < deadline:
                 try:
-                    if self.ser.in_waiting:
-                        line = self.ser.readline().decode('utf-8', errors='replace').strip()
-                        if 'READY' in line:
-                            ready_received = True
-                            break
+                    # Blocking readline (port timeout=1 s): wakes as soon as a
+                    # line arrives instead of polling in_waiting every 100 ms
+                    line = self.ser.readline()
                 except (OSError, serial.SerialException):
                     break  # Port disappeared during boot wait
-                time.sleep(0.1)
+                if b'READY' in line:
+                    ready_received = True
+                    break
 
             if ready_received:
                 self.connected = True
@@ -153,8 +221,48 @@ class SerialManager:
                 pass
             time.sleep(0.01)
 
+    def _servo_writer_loop(self):
+        """Background thread: write the newest queued servo packet to the port.
+
+        Runs until close(); a packet queued before close() is still written.
+        """
+        slot = self._servo_slot
+        while True:
+            self._servo_ready.wait(0.1)
+            self._servo_ready.clear()
+            # Read the flag before draining: a packet queued before close()
+            # cleared it is flushed by this final pass
+            stopping = not self.running
+            while slot:
+                # Hand pyserial immutable bytes: it writes them to the fd as-is, while a
+                # reused bytearray/memoryview would be copied to bytes on every call.
+                self._write_servo(slot.popleft())
+            if stopping:
+                break
+
     def send_servo(self, packet):
-        """Send servo packet to ESP32 with defensive error handling"""
+        """Send a servo packet to the ESP32.
+
+        Default (synchronous): True once the packet has been written.
+        async_writes=True: True once the packet is queued, not written. The
+        writer sends it later; a newer packet replaces it if it is still unsent
+        (so only send full-frame poses this way, not servo deltas), and write
+        failures show up as connected=False, not in this return value.
+        False means the packet was not sent (or queued) at all.
+        """
+        if self._servo_thread is not None and self.running and self.connected:
+            self._servo_slot.append(packet)
+            self._servo_ready.set()
+            return True
+        return self._write_servo(packet)
+
+    def _write_servo(self, packet):
+        """Write a servo packet to ESP32 with defensive error handling"""
+        with self._write_lock:
+            return self._write_servo_locked(packet)
+
+    def _write_servo_locked(self, packet):
+        """_write_servo body; caller holds _write_lock"""
         if not self.connected:
             # Log warning so user knows packets are being dropped
             print("[WARN] Servo packet dropped - serial not connected!")
@@ -213,6 +321,11 @@ class SerialManager:
 
     def send_led(self, packet):
         """Send LED packet to ESP32 with defensive error handling"""
+        with self._write_lock:
+            return self._send_led_locked(packet)
+
+    def _send_led_locked(self, packet):
+        """send_led body, including the reconnect retry; caller holds _write_lock"""
         if not self.connected:
             print("[WARN] LED packet dropped - serial not connected!")
             return False
@@ -257,16 +370,24 @@ class SerialManager:
     def close(self):
         """Close serial connection"""
         self.running = False
-        if self.ser:
-            try:
-                self.ser.reset_output_buffer()
-            except Exception:
-                pass
-            try:
-                self.ser.close()
-            except Exception:
-                pass
-        self.connected = False
+        if self._servo_thread is not None:
+            self._servo_ready.set()  # Wake the writer: it sends the pending pose, then exits
+            self._servo_thread.join(timeout=1.0)
+        with self._write_lock:
+            if self.ser:
+                try:
+                    if self._servo_thread is not None:
+                        # Let the writer's final pose reach the wire, don't discard it
+                        self.ser.flush()
+                    else:
+                        self.ser.reset_output_buffer()
+                except Exception:
+                    pass
+                try:
+                    self.ser.close()
+                except Exception:
+                    pass
+            self.connected = False
 
     def stop(self):
         """Alias for close() used by GUI shutdown"""
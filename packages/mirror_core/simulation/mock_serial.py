@@ -2,8 +2,11 @@
 """
 Mock Serial Interface
 Mimics serial.Serial for the Virtual ESP32
+
+Set MIRROR_SIM_FAST=1 to skip the simulated connection delay (headless/CI runs).
 """
 
+import os
 import time
 from .virtual_esp32 import VirtualESP32
 
@@ -11,6 +14,9 @@ from .virtual_esp32 import VirtualESP32
 # This is necessary because SerialManager instantiates the class, but the Visualizer needs to peek inside.
 _VIRTUAL_DEVICE = None
 
+# Cosmetic delays only matter when someone is watching the simulator
+SIM_FAST = os.environ.get('MIRROR_SIM_FAST', '0') == '1'
+
 def get_virtual_device_instance():
     global _VIRTUAL_DEVICE
     if _VIRTUAL_DEVICE is None:
@@ -26,7 +32,8 @@ class MockSerial:
         self.device = get_virtual_device_instance()
         
         # Simulate connection time
-        time.sleep(0.1)
+        if not SIM_FAST:
+            time.sleep(0.1)
         print(f"[MOCK] Connected to Virtual ESP32 on {port}")
 
     def write(self, data):
@@ -42,15 +49,15 @@ class MockSerial:
         # In real serial, this would block potentially.
         # Here we just peek if there is data
         data = b''
-        start_time = time.time()
+        deadline = time.perf_counter() + (self.timeout or 0)
         
         while len(data) < size:
             chunk = self.device.read()
             if chunk:
                 data += chunk
             else:
-                # If timeout passed, break
-                if self.timeout and (time.time() - start_time > self.timeout):
+                # If timeout passed, break (monotonic clock, not wall time)
+                if self.timeout and time.perf_counter() > deadline:
                     break
                 time.sleep(0.01)
                 
@@ -76,6 +83,9 @@ class MockSerial:
 
     def reset_output_buffer(self):
         pass
+
+    def flush(self):
+        pass  # Writes reach the virtual device synchronously
         
     # Dummy properties for dtr/rts
     @property
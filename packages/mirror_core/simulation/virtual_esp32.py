@@ -7,14 +7,14 @@ Mimics the behavior of the real ESP32 firmware for LEDs and Motors.
 import threading
 import time
 import queue
-from collections import deque
+import numpy as np
 
 class VirtualESP32:
     def __init__(self):
         self.running = True
-        self.led_state = [0] * (2048)  # 2048 LEDs (brightness)
-        self.motor_angles = [90] * 64   # 64 Servos (0-180 degrees)
-        self.buffer = deque()
+        self.led_state = np.zeros(2048, dtype=np.uint8)  # 2048 LEDs (brightness)
+        self.motor_angles = np.full(64, 90.0)  # 64 Servos (0-180 degrees)
+        self.buffer = bytearray()  # Contiguous RX buffer - slices are C copies
         self.state_lock = threading.Lock()
         
         # Output queue (to send data back to PC, e.g. "READY")
@@ -46,14 +46,19 @@ class VirtualESP32:
         # Simple finite state machine or just look for headers
         # Protocol: 
         #   Header: AA BB
-        #   Type:   01 (LED) or 02 (Servo)
+        #   Type:   01 (LED), 02 (Servo) or 08 (Servo delta)
         #   Data:   ...
         
         while len(self.buffer) > 2:
-             # Look for Header AA BB
-            if self.buffer[0] != 0xAA or self.buffer[1] != 0xBB:
-                 # Pop byte and continue
-                self.buffer.popleft()
+            # Look for Header AA BB (one C-level scan instead of popping byte by byte)
+            start = self.buffer.find(b'\xAA\xBB')
+            if start < 0:
+                # No header - drop the junk, but keep a trailing 0xAA (half a header)
+                keep = 1 if self.buffer[-1] == 0xAA else 0
+                del self.buffer[:len(self.buffer) - keep]
+                return
+            if start > 0:
+                del self.buffer[:start]
                 continue
             
             # Found Header
@@ -67,14 +72,11 @@ class VirtualESP32:
                 if len(self.buffer) < 2051:
                     return # Wait for more data
                 
-                # Extract LED data
-                led_data = list(self.buffer)[3:2051]
-                self.led_state = led_data # Update state
+                # Extract LED data (one 2 KB copy, no per-byte Python ints)
+                self.led_state = np.frombuffer(self.buffer[3:2051], dtype=np.uint8)
                 
                 # Consume packet
-                # Consume packet
-                for _ in range(2051):
-                    self.buffer.popleft()
+                del self.buffer[:2051]
                 
             elif packet_type == 0x02: # Servo Packet
                 # Needs 64 * 2 bytes + 3 header bytes = 131 bytes
@@ -86,43 +88,37 @@ class VirtualESP32:
                 if len(self.buffer) < total_size:
                     return # Wait for more data
                 
-                buf_list = list(self.buffer)
-                
                 # Extract Servo data
                 # 64 servos, 2 bytes each (High byte, Low byte)
-                # Value 0-1000 maps to 0-180 degrees
-                new_angles = []
-                for i in range(num_servos):
-                    idx = 3 + (i * 2)
-                    hi = buf_list[idx]
-                    lo = buf_list[idx+1]
-                    val = (hi << 8) | lo
-                    val = max(0, min(1000, val))  # Bounds check
-                    
-                    # Map 0-1000 -> 0-180
-                    angle = (val / 1000.0) * 180.0
-                    new_angles.append(angle)
+                # Value 0-1000 maps to 0-180 degrees - decoded for all servos at once
+                vals = np.frombuffer(self.buffer[3:total_size], dtype='>u2')
+                vals = np.minimum(vals, 1000)  # Bounds check
+                self.motor_angles[:num_servos] = (vals / 1000.0) * 180.0
                 
-                # Ensure we have enough slots
-                if len(self.motor_angles) < num_servos:
-                     self.motor_angles = [90] * num_servos
-
-                for i in range(min(len(new_angles), len(self.motor_angles))):
-                    self.motor_angles[i] = new_angles[i]
+                # Consume packet
+                del self.buffer[:total_size]
+                
+            elif packet_type == 0x08: # Servo Delta Packet (one servo)
+                # 3 header bytes + id + uint16 value = 6 bytes
+                if len(self.buffer) < 6:
+                    return # Wait for more data
+                
+                servo_id = self.buffer[3]
+                val = min(1000, (self.buffer[4] << 8) | self.buffer[5])
+                if servo_id < len(self.motor_angles):
+                    self.motor_angles[servo_id] = (val / 1000.0) * 180.0
                 
                 # Consume packet
-                for _ in range(total_size):
-                    self.buffer.popleft()
+                del self.buffer[:6]
                 
             else:
                  # Unknown packet type, skip header
-                self.buffer.popleft()
-                self.buffer.popleft()
+                del self.buffer[:2]
 
     def get_server_state(self):
         """Thread-safe access to state for visualizer"""
         with self.state_lock:
             return {
-                "leds": list(self.led_state),
-                "motors": list(self.motor_angles)
+                "leds": self.led_state.tolist(),
+                "motors": self.motor_angles.tolist()
             }
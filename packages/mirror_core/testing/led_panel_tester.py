@@ -88,17 +88,14 @@ class LEDPanelTester:
 
     def generate_panel_brightness_levels(self):
         pattern = np.zeros((self.height, self.width), dtype=np.uint8)
-        brightness_levels = [30, 60, 90, 120, 150, 180, 210, 255]
-        panel_number = 0
+        brightness_levels = np.array([30, 60, 90, 120, 150, 180, 210, 255], dtype=np.uint8)
 
-        for row in range(self.panels_rows):
-            for col in range(self.panels_cols):
-                y_start = row * 16
-                y_end = y_start + 16
-                x_start = col * 16
-                x_end = x_start + 16
-                pattern[y_start:y_end, x_start:x_end] = brightness_levels[panel_number]
-                panel_number += 1
+        # Panel-grid of levels (row-major), blown up to 16x16 tiles in one pass
+        grid = brightness_levels[:self.panels_rows * self.panels_cols].reshape(self.panels_rows, self.panels_cols)
+        tiles = np.repeat(np.repeat(grid, 16, axis=0), 16, axis=1)
+        h = min(self.height, tiles.shape[0])
+        w = min(self.width, tiles.shape[1])
+        pattern[:h, :w] = tiles[:h, :w]
 
         return pattern
     
@@ -117,10 +114,8 @@ class LEDPanelTester:
         """Generate gradient test pattern"""
         gradient = np.zeros((self.height, self.width), dtype=np.uint8)
         
-        # Horizontal gradient
-        for x in range(self.width):
-            value = int((x / self.width) * 255)
-            gradient[:, x] = value
+        # Horizontal gradient: one column ramp broadcast down every row
+        gradient[:] = ((np.arange(self.width) / self.width) * 255).astype(np.uint8)
         
         return gradient
     
@@ -128,10 +123,9 @@ class LEDPanelTester:
         """Generate checkerboard pattern"""
         pattern = np.zeros((self.height, self.width), dtype=np.uint8)
         
-        for y in range(self.height):
-            for x in range(self.width):
-                if ((y // square_size) + (x // square_size)) % 2 == 0:
-                    pattern[y, x] = 255
+        # Parity of the square index, broadcast over the whole frame at once
+        ys, xs = np.ogrid[:self.height, :self.width]
+        pattern[((ys // square_size) + (xs // square_size)) % 2 == 0] = 255
         
         return pattern
     
@@ -139,16 +133,9 @@ class LEDPanelTester:
         """Draw borders around each 16×16 panel"""
         pattern = np.zeros((self.height, self.width), dtype=np.uint8)
         
-        # Draw borders
-        for row in range(self.panels_rows + 1):
-            y = row * 16
-            if y < self.height:
-                pattern[y, :] = 255
-        
-        for col in range(self.panels_cols + 1):
-            x = col * 16
-            if x < self.width:
-                pattern[:, x] = 255
+        # Draw borders: every 16th row/column up to the far panel edge, as strided stores
+        pattern[0:self.panels_rows * 16 + 1:16, :] = 255
+        pattern[:, 0:self.panels_cols * 16 + 1:16] = 255
         
         return pattern
     
@@ -14,8 +14,18 @@ import time
 import json
 import os
 import sys
+import traceback
 from datetime import datetime
 
+try:
+    import orjson  # Optional: much faster JSON for the results file
+except ImportError:
+    orjson = None
+
+# One PCG64 generator for all synthetic test frames (faster than the legacy
+# np.random.randint global state, and seedable in one place)
+RNG = np.random.default_rng()
+
 
 def time_it(func, runs=30, warmup=5):
     """Time a function, return stats in ms."""
@@ -101,7 +111,7 @@ def test_resize_speed():
     results = []
 
     # Simulate camera frame
-    src = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+    src = RNG.integers(0, 255, (480, 640, 3), dtype=np.uint8)
 
     methods = [
         ('INTER_NEAREST', cv2.INTER_NEAREST),
@@ -165,7 +175,7 @@ def test_segmentation_speed():
             segmenter = mp_vision.ImageSegmenter.create_from_options(options)
 
             # Create test frame
-            test_frame = np.random.randint(0, 255, (h, w, 3), dtype=np.uint8)
+            test_frame = RNG.integers(0, 255, (h, w, 3), dtype=np.uint8)
             frame_count = [0]
 
             def run_seg():
@@ -199,7 +209,7 @@ def test_morphology_speed():
     print("=" * 60)
     results = []
 
-    mask = np.random.randint(0, 255, (240, 320), dtype=np.uint8)
+    mask = RNG.integers(0, 255, (240, 320), dtype=np.uint8)
 
     kernel_sizes = [3, 5, 7, 9, 11]
     for k in kernel_sizes:
@@ -229,7 +239,7 @@ def test_queue_latency():
     import threading
     results = []
 
-    frame = np.random.randint(0, 255, (240, 320, 3), dtype=np.uint8)
+    frame = RNG.integers(0, 255, (240, 320, 3), dtype=np.uint8)
 
     for maxsize in [1, 2, 3, 5]:
         q = queue.Queue(maxsize=maxsize)
@@ -442,17 +452,26 @@ def test_packet_build_speed():
         data = struct.pack('>' + 'H' * len(values), *values)
         return header + data
 
-    # Method 3: numpy
+    # Method 3: numpy, cast straight to big-endian uint16 (as MotorController
+    # does): one conversion, no byteswap pass, correct on any host byte order
     def build_numpy():
         header = b'\xAA\xBB\x02'
-        arr = np.clip(np.array(angles) * 1000 / 180, 0, 1000).astype(np.uint16)
-        arr = arr.byteswap()  # big-endian
+        arr = np.clip(np.array(angles) * 1000 / 180, 0, 1000).astype('>u2')
         return header + arr.tobytes()
 
+    # Method 4: struct.Struct compiled once (format parsed outside the call,
+    # as stress_test's SERVO_PACKET does)
+    servo_struct = struct.Struct(f'>3s{len(angles)}H')
+
+    def build_struct():
+        values = [max(0, min(1000, int(a * 1000 / 180))) for a in angles]
+        return servo_struct.pack(b'\xAA\xBB\x02', *values)
+
     methods = [
         ('Loop + struct.pack', build_loop),
         ('Batch struct.pack', build_batch),
-        ('NumPy tobytes', build_numpy),
+        ('NumPy >u2 tobytes', build_numpy),
+        ('Precompiled Struct', build_struct),
     ]
 
     results = []
@@ -534,7 +553,6 @@ def main():
             all_results['full_pipeline'] = test_full_pipeline(cam_idx)
         except Exception as e:
             print(f"  ✗ Pipeline test failed: {e}")
-            import traceback
             traceback.print_exc()
             all_results['full_pipeline'] = {'error': str(e)}
 
@@ -550,8 +568,12 @@ def main():
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, 'pc_benchmark_results.json')
 
-    with open(log_file, 'w') as f:
-        json.dump(all_results, f, indent=2, default=str)
+    if orjson is not None:
+        with open(log_file, 'wb') as f:
+            f.write(orjson.dumps(all_results, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(log_file, 'w') as f:
+            json.dump(all_results, f, indent=2, default=str)
 
     print(f"\n{'=' * 60}")
     print(f"Results saved to: {os.path.abspath(log_file)}")
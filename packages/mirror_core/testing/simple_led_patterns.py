@@ -7,46 +7,35 @@ import numpy as np
 def generate_vertical_bars(width=32, height=64):
     """Vertical bars pattern - alternating columns"""
     pattern = np.zeros((height, width), dtype=np.uint8)
-    for x in range(width):
-        if x % 2 == 0:
-            pattern[:, x] = 255
+    pattern[:, 0::2] = 255  # Every even column in one strided store
     return pattern
 
 
 def generate_horizontal_bars(width=32, height=64):
     """Horizontal bars pattern - alternating rows"""
     pattern = np.zeros((height, width), dtype=np.uint8)
-    for y in range(height):
-        if y % 2 == 0:
-            pattern[y, :] = 255
+    pattern[0::2, :] = 255  # Every even row in one strided store
     return pattern
 
 
 def generate_diagonal_gradient(width=32, height=64):
     """Diagonal gradient pattern"""
-    pattern = np.zeros((height, width), dtype=np.uint8)
     max_dist = np.sqrt(width**2 + height**2)
-    for y in range(height):
-        for x in range(width):
-            dist = np.sqrt(x**2 + y**2)
-            value = int((dist / max_dist) * 255)
-            pattern[y, x] = value
-    return pattern
+    ys, xs = np.ogrid[:height, :width]
+    dist = np.sqrt(xs**2 + ys**2)
+    return ((dist / max_dist) * 255).astype(np.uint8)
 
 
 def generate_concentric_squares(width=32, height=64):
     """Concentric squares from center"""
-    pattern = np.zeros((height, width), dtype=np.uint8)
     center_x = width // 2
     center_y = height // 2
+    max_dist = max(center_x, center_y)
     
-    for y in range(height):
-        for x in range(width):
-            dist = max(abs(x - center_x), abs(y - center_y))
-            max_dist = max(center_x, center_y)
-            value = int((dist / max_dist) * 255)
-            pattern[y, x] = value
-    return pattern
+    # Chebyshev distance from the center, for the whole frame at once
+    ys, xs = np.ogrid[:height, :width]
+    dist = np.maximum(np.abs(xs - center_x), np.abs(ys - center_y))
+    return ((dist / max_dist) * 255).astype(np.uint8)
 
 
 def generate_panel_brightness_test(width=32, height=64):
@@ -99,14 +88,10 @@ def generate_panel_corners(width=32, height=64):
             y_start = row * 16
             x_start = col * 16
             
-            # Draw a 4×4 bright square at specific corner
+            # Draw a 4×4 bright square at specific corner (slicing clips at the edge)
             cy, cx = corner_patterns[panel_idx]
-            for dy in range(4):
-                for dx in range(4):
-                    y = y_start + cy + dy
-                    x = x_start + cx + dx
-                    if y < height and x < width:
-                        pattern[y, x] = 255
+            y, x = y_start + cy, x_start + cx
+            pattern[y:y + 4, x:x + 4] = 255
             
             panel_idx += 1
     
@@ -116,9 +101,8 @@ def generate_panel_corners(width=32, height=64):
 def generate_pulse_wave(width=32, height=64, frequency=4):
     """Horizontal pulse wave pattern"""
     pattern = np.zeros((height, width), dtype=np.uint8)
-    for x in range(width):
-        value = int((np.sin(x * frequency * 2 * np.pi / width) + 1) * 127.5)
-        pattern[:, x] = value
+    xs = np.arange(width)
+    pattern[:] = ((np.sin(xs * frequency * 2 * np.pi / width) + 1) * 127.5).astype(np.uint8)
     return pattern
 
 
@@ -11,6 +11,7 @@ Requires: stress_test_firmware.ino flashed to ESP32
 """
 
 import serial
+import math
 import struct
 import time
 import json
@@ -19,26 +20,53 @@ import sys
 import argparse
 from datetime import datetime
 
+# Add project root to path (also works when run as a plain script)
+project_root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from packages.mirror_core.utils.timing import pace
+
+try:
+    import orjson  # Optional: much faster JSON for the results file
+except ImportError:
+    orjson = None
+
 
 # ======================= CONFIG =======================
 BAUD_RATES = [460800, 921600, 1000000, 2000000]
 MOTOR_SEND_RATES = [30, 60, 120, 200, 500]  # Hz
 WRITE_TIMEOUTS = [0.05, 0.1, 0.5, 1.0]  # seconds
 TEST_DURATION = 5  # seconds per test
+SHARED_PORT_TESTS = {2, 3, 4, 5}  # Tests that can reuse one base-baud connection
 
 NUM_SERVOS = 64
 SERVO_PACKET_SIZE = 3 + NUM_SERVOS * 2  # Header(3) + Data(128) = 131 bytes
+SERVO_HEADER = b'\xAA\xBB\x02'
+FRAME_INTERVAL = 1.0 / 60  # 60 Hz streaming in the sweep tests
+SERVO_PACKET = struct.Struct(f'>3s{NUM_SERVOS}H')  # Format compiled once
+SERVO_VALUE = struct.Struct('>H')
 
 
 def build_servo_packet(angles):
     """Build a servo packet identical to production format."""
-    header = b'\xAA\xBB\x02'
-    data = b''
-    for angle in angles:
-        value = int(angle * 1000 / 180)  # 0-180 → 0-1000
-        value = max(0, min(1000, value))
-        data += struct.pack('>H', value)
-    return header + data
+    values = [max(0, min(1000, int(angle * 1000 / 180))) for angle in angles]  # 0-180 → 0-1000
+    if len(values) == NUM_SERVOS:
+        return SERVO_PACKET.pack(SERVO_HEADER, *values)
+    return SERVO_HEADER + struct.pack(f'>{len(values)}H', *values)
+
+
+def build_uniform_servo_packet(angle):
+    """Servo packet with every servo at one angle: the value is computed once
+    and its two bytes repeated, instead of converting NUM_SERVOS equal angles."""
+    value = max(0, min(1000, int(angle * 1000 / 180)))
+    return SERVO_HEADER + SERVO_VALUE.pack(value) * NUM_SERVOS
+
+
+def sweep_angle(t, speed):
+    """Sine sweep 45-135 deg. Scalar math.sin on purpose: np.sin on a single
+    float pays array dispatch and is ~10x slower."""
+    return 90 + 45 * math.sin(t * speed)
 
 
 def wait_for_ready(ser, timeout=25):
@@ -47,9 +75,9 @@ def wait_for_ready(ser, timeout=25):
     Reads raw bytes and buffers lines manually because the ESP32
     prints WiFi dots without newlines, which blocks readline().
     """
-    start = time.time()
+    start = time.perf_counter()
     buf = b''
-    while time.time() - start < timeout:
+    while time.perf_counter() - start < timeout:
         if ser.in_waiting:
             chunk = ser.read(ser.in_waiting)
             buf += chunk
@@ -73,28 +101,58 @@ def wait_for_ready(ser, timeout=25):
     return False
 
 
-def read_esp_stats(ser, timeout=0.5):
-    """Read all available stats from ESP32."""
+def open_test_port(port, baud, timeout=1):
+    """Open the port and wait for the firmware banner.
+
+    Returns None (with the port closed) if the ESP32 never reports ready.
+    """
+    ser = serial.Serial(port, baud, timeout=timeout, write_timeout=1.0)
+    if hasattr(ser, 'set_buffer_size'):  # Windows backend only
+        ser.set_buffer_size(rx_size=4096, tx_size=1 << 16)
+    time.sleep(0.5)
+    if not wait_for_ready(ser, timeout=3):
+        ser.close()
+        return None
+    return ser
+
+
+def read_esp_stats(ser, timeout=0.5, until=None):
+    """Read all available stats from ESP32.
+
+    Only drains bytes already buffered, so a partial line never blocks in
+    readline(). With ``until`` (a prefix or tuple of prefixes) it returns as
+    soon as a matching line arrives instead of waiting out the timeout.
+    """
     lines = []
-    start = time.time()
-    while time.time() - start < timeout:
-        if ser.in_waiting:
-            try:
-                line = ser.readline().decode('utf-8', errors='replace').strip()
-                if line:
-                    lines.append(line)
-            except Exception:
-                pass
-        else:
-            time.sleep(0.01)
+    buf = b''
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            waiting = ser.in_waiting
+            if not waiting:
+                time.sleep(0.01)
+                continue
+            buf += ser.read(waiting)
+        except (serial.SerialException, OSError):
+            break
+        *complete, buf = buf.split(b'\n')
+        for raw in complete:
+            line = raw.decode('utf-8', errors='replace').strip()
+            if line:
+                lines.append(line)
+                if until and line.startswith(until):
+                    return lines
+    line = buf.decode('utf-8', errors='replace').strip()
+    if line:
+        lines.append(line)
     return lines
 
 
 def send_command(ser, cmd):
-    """Send a command to the stress test firmware."""
+    """Send a command to the stress test firmware and return its reply lines."""
     ser.write(f"{cmd}\n".encode())
-    time.sleep(0.1)
-    return read_esp_stats(ser, timeout=0.5)
+    # Every command answers with an OK/STATUS line - stop there, not at the timeout
+    return read_esp_stats(ser, timeout=0.6, until=('OK', 'STATUS'))
 
 
 def parse_stats(lines):
@@ -141,21 +199,22 @@ def test_baud_rates(port):
             # Send motor packets at 60 Hz for TEST_DURATION seconds
             packets_sent = 0
             errors = 0
-            start = time.time()
+            start = time.perf_counter()
+            next_t = start
 
-            while time.time() - start < TEST_DURATION:
+            while next_t - start < TEST_DURATION:
                 try:
                     # Sweep angle pattern
-                    t = time.time() - start
-                    angle = 90 + 45 * __import__('math').sin(t * 2)
-                    packet = build_servo_packet([angle] * NUM_SERVOS)
+                    t = next_t - start
+                    angle = sweep_angle(t, 2)
+                    packet = build_uniform_servo_packet(angle)
                     ser.write(packet)
                     packets_sent += 1
                 except (serial.SerialTimeoutException, OSError) as e:
                     errors += 1
 
                 # 60 Hz
-                time.sleep(1.0 / 60)
+                next_t = pace(next_t, FRAME_INTERVAL)
 
             # Get stats from ESP32
             esp_lines = read_esp_stats(ser, timeout=1.5)
@@ -185,20 +244,22 @@ def test_baud_rates(port):
     return results
 
 
-def test_motor_send_rate(port, baud=460800):
-    """Test motor packet send rate from 30 to 500 Hz."""
+def test_motor_send_rate(port, baud=460800, ser=None):
+    """Test motor packet send rate from 30 to 500 Hz.
+
+    Pass an already-open, ready port as ``ser`` to share it between tests.
+    """
     print("\n" + "=" * 60)
     print(f"TEST 2: MOTOR SEND RATE SWEEP (at {baud} baud)")
     print("=" * 60)
     results = []
+    own_port = ser is None
 
     try:
-        ser = serial.Serial(port, baud, timeout=1, write_timeout=1.0)
-        time.sleep(0.5)
-
-        if not wait_for_ready(ser, timeout=3):
+        if own_port:
+            ser = open_test_port(port, baud)
+        if ser is None:
             print("  ⚠ ESP32 not responding")
-            ser.close()
             return results
 
         for rate in MOTOR_SEND_RATES:
@@ -210,25 +271,22 @@ def test_motor_send_rate(port, baud=460800):
 
             packets_sent = 0
             errors = 0
-            start = time.time()
+            start = time.perf_counter()
+            next_t = start
             interval = 1.0 / rate
 
-            while time.time() - start < TEST_DURATION:
+            while next_t - start < TEST_DURATION:
                 try:
-                    t = time.time() - start
-                    angle = 90 + 45 * __import__('math').sin(t * 3)
-                    packet = build_servo_packet([angle] * NUM_SERVOS)
+                    t = next_t - start
+                    angle = sweep_angle(t, 3)
+                    packet = build_uniform_servo_packet(angle)
                     ser.write(packet)
                     packets_sent += 1
                 except (serial.SerialTimeoutException, OSError):
                     errors += 1
 
-                # Precise timing
-                elapsed = time.time() - start
-                next_time = (packets_sent + 1) * interval
-                sleep_time = next_time - elapsed
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                # Precise timing (failed writes still use up their slot)
+                next_t = pace(next_t, interval)
 
             # Read stats
             time.sleep(0.5)  # Let ESP32 report
@@ -249,62 +307,67 @@ def test_motor_send_rate(port, baud=460800):
             print(f"  Target: {rate} Hz | Actual send: {result['actual_rate']:.0f} Hz | "
                   f"ESP recv: {recv_rate:.0f} Hz | Errors: {errors}")
 
-        ser.close()
-
     except serial.SerialException as e:
         print(f"  ✗ Serial error: {e}")
+    finally:
+        if own_port and ser is not None:
+            ser.close()
 
     return results
 
 
-def test_latency(port, baud=460800):
-    """Measure round-trip latency for motor packets."""
+def test_latency(port, baud=460800, ser=None):
+    """Measure round-trip latency for motor packets.
+
+    Pass an already-open, ready port as ``ser`` to share it between tests.
+    """
     print("\n" + "=" * 60)
     print(f"TEST 3: ROUND-TRIP LATENCY (at {baud} baud)")
     print("=" * 60)
+    own_port = ser is None
+    prev_timeout = None
 
     try:
-        ser = serial.Serial(port, baud, timeout=0.1, write_timeout=1.0)
-        time.sleep(0.5)
-
-        if not wait_for_ready(ser, timeout=3):
+        if own_port:
+            ser = open_test_port(port, baud, timeout=0.1)
+        if ser is None:
             print("  ⚠ ESP32 not responding")
-            ser.close()
             return {}
 
+        # 100 ms read timeout: the per-packet ACK wait and a stall guard
+        prev_timeout = ser.timeout
+        ser.timeout = 0.1
+
         # Enable ACK mode
         send_command(ser, "ACK:ON")
         time.sleep(0.2)
 
+        # Same neutral frame every round - build it once, outside the timed loop
+        packet = build_uniform_servo_packet(90)
+
         latencies = []
         for i in range(100):
             # Flush input
             while ser.in_waiting:
                 ser.read(ser.in_waiting)
 
-            packet = build_servo_packet([90] * NUM_SERVOS)
             t0 = time.perf_counter()
             ser.write(packet)
 
-            # Wait for ACK
-            ack_received = False
-            while time.perf_counter() - t0 < 0.1:  # 100ms timeout
-                if ser.in_waiting:
-                    data = ser.readline().decode('utf-8', errors='replace').strip()
-                    if 'ACK' in data:
-                        t1 = time.perf_counter()
-                        latencies.append((t1 - t0) * 1000)  # ms
-                        ack_received = True
-                        break
-
-            if not ack_received:
+            # Wait for ACK: one blocking read that returns the moment the
+            # firmware's "ACK" arrives (ser.timeout = 0.1 s bounds the whole
+            # call) instead of spinning on in_waiting
+            data = ser.read_until(b'ACK')
+            if data.endswith(b'ACK'):
+                t1 = time.perf_counter()
+                latencies.append((t1 - t0) * 1000)  # ms
+            else:
                 latencies.append(-1)  # Timeout
 
             time.sleep(0.02)  # 50 Hz
 
         # Disable ACK mode
         send_command(ser, "ACK:OFF")
-        ser.close()
 
         valid = [l for l in latencies if l > 0]
         if valid:
@@ -328,77 +391,105 @@ def test_latency(port, baud=460800):
     except serial.SerialException as e:
         print(f"  ✗ Serial error: {e}")
         return {'error': str(e)}
+    finally:
+        if ser is not None:
+            if own_port:
+                ser.close()
+            elif prev_timeout is not None:
+                ser.timeout = prev_timeout
+
 
+def test_write_timeout(port, baud=460800, ser=None):
+    """Test different write timeout values.
 
-def test_write_timeout(port, baud=460800):
-    """Test different write timeout values."""
+    Pass an already-open, ready port as ``ser`` to share it between tests.
+    write_timeout is changed in place for each step and restored afterwards.
+    """
     print("\n" + "=" * 60)
     print(f"TEST 4: WRITE TIMEOUT SWEEP (at {baud} baud)")
     print("=" * 60)
     results = []
+    own_port = ser is None
 
-    for timeout in WRITE_TIMEOUTS:
-        print(f"\n--- Testing write_timeout={timeout}s ---")
-        try:
-            ser = serial.Serial(port, baud, timeout=1, write_timeout=timeout)
-            time.sleep(0.3)
-
-            packets_sent = 0
-            timeout_errors = 0
-            other_errors = 0
-            start = time.time()
+    try:
+        if own_port:
+            ser = open_test_port(port, baud)
+        if ser is None:
+            print("  ⚠ ESP32 not responding")
+            return results
 
-            while time.time() - start < TEST_DURATION:
+        original_timeout = ser.write_timeout
+        try:
+            for timeout in WRITE_TIMEOUTS:
+                print(f"\n--- Testing write_timeout={timeout}s ---")
                 try:
-                    t = time.time() - start
-                    angle = 90 + 45 * __import__('math').sin(t * 3)
-                    packet = build_servo_packet([angle] * NUM_SERVOS)
-                    ser.write(packet)
-                    packets_sent += 1
-                except serial.SerialTimeoutException:
-                    timeout_errors += 1
-                except OSError:
-                    other_errors += 1
-
-                time.sleep(1.0 / 60)  # 60 Hz
-
-            result = {
-                'write_timeout': timeout,
-                'packets_sent': packets_sent,
-                'timeout_errors': timeout_errors,
-                'other_errors': other_errors,
-                'success_rate': f"{packets_sent / max(packets_sent + timeout_errors, 1) * 100:.1f}%"
-            }
-            results.append(result)
-
-            print(f"  Sent: {packets_sent} | Timeouts: {timeout_errors} | "
-                  f"Other: {other_errors} | Success: {result['success_rate']}")
-
+                    # pyserial reapplies the setting on the open port - no reopen/reboot
+                    ser.write_timeout = timeout
+
+                    packets_sent = 0
+                    timeout_errors = 0
+                    other_errors = 0
+                    start = time.perf_counter()
+                    next_t = start
+
+                    while next_t - start < TEST_DURATION:
+                        try:
+                            t = next_t - start
+                            angle = sweep_angle(t, 3)
+                            packet = build_uniform_servo_packet(angle)
+                            ser.write(packet)
+                            packets_sent += 1
+                        except serial.SerialTimeoutException:
+                            timeout_errors += 1
+                        except OSError:
+                            other_errors += 1
+
+                        next_t = pace(next_t, FRAME_INTERVAL)  # 60 Hz
+
+                    result = {
+                        'write_timeout': timeout,
+                        'packets_sent': packets_sent,
+                        'timeout_errors': timeout_errors,
+                        'other_errors': other_errors,
+                        'success_rate': f"{packets_sent / max(packets_sent + timeout_errors, 1) * 100:.1f}%"
+                    }
+                    results.append(result)
+
+                    print(f"  Sent: {packets_sent} | Timeouts: {timeout_errors} | "
+                          f"Other: {other_errors} | Success: {result['success_rate']}")
+
+                    time.sleep(0.2)  # Let the TX queue drain before the next step
+
+                except serial.SerialException as e:
+                    print(f"  ✗ Failed: {e}")
+                    results.append({'write_timeout': timeout, 'error': str(e)})
+        finally:
+            ser.write_timeout = original_timeout
+
+    finally:
+        if own_port and ser is not None:
             ser.close()
-            time.sleep(0.2)
-
-        except serial.SerialException as e:
-            print(f"  ✗ Failed: {e}")
-            results.append({'write_timeout': timeout, 'error': str(e)})
 
     return results
 
 
-def test_firmware_params(port, baud=460800):
-    """Test firmware parameters: smoothing alpha, loop delay, I2C speed, PWM freq."""
+def test_firmware_params(port, baud=460800, ser=None):
+    """Test firmware parameters: smoothing alpha, loop delay, I2C speed, PWM freq.
+
+    Pass an already-open, ready port as ``ser`` to share it between tests.
+    """
     print("\n" + "=" * 60)
     print(f"TEST 5: FIRMWARE PARAMETER SWEEP (at {baud} baud)")
     print("=" * 60)
     print("  Requires stress_test_firmware.ino on ESP32\n")
     results = {}
+    own_port = ser is None
 
     try:
-        ser = serial.Serial(port, baud, timeout=1, write_timeout=1.0)
-        time.sleep(0.5)
-
-        if not wait_for_ready(ser, timeout=3):
+        if own_port:
+            ser = open_test_port(port, baud)
+        if ser is None:
             print("  ⚠ ESP32 not responding")
-            ser.close()
             return results
 
         # --- Test smoothing alpha ---
@@ -411,12 +502,13 @@ def test_firmware_params(port, baud=460800):
 
             # Send ramp pattern and measure response
             send_command(ser, "RESET")
-            start = time.time()
-            while time.time() - start < 2:
-                t = time.time() - start
+            start = time.perf_counter()
+            next_t = start
+            while next_t - start < 2:
+                t = next_t - start
                 angle = 45 + 90 * (t / 2)  # Ramp from 45 to 135
-                ser.write(build_servo_packet([angle] * NUM_SERVOS))
-                time.sleep(1.0 / 60)
+                ser.write(build_uniform_servo_packet(angle))
+                next_t = pace(next_t, FRAME_INTERVAL)
 
             time.sleep(0.5)
             stats = parse_stats(read_esp_stats(ser, timeout=1))
@@ -432,12 +524,13 @@ def test_firmware_params(port, baud=460800):
             print(f"    DELAY={delay_ms}ms: {resp}")
             send_command(ser, "RESET")
 
-            start = time.time()
-            while time.time() - start < 2:
-                t = time.time() - start
-                angle = 90 + 45 * __import__('math').sin(t * 4)
-                ser.write(build_servo_packet([angle] * NUM_SERVOS))
-                time.sleep(1.0 / 60)
+            start = time.perf_counter()
+            next_t = start
+            while next_t - start < 2:
+                t = next_t - start
+                angle = sweep_angle(t, 4)
+                ser.write(build_uniform_servo_packet(angle))
+                next_t = pace(next_t, FRAME_INTERVAL)
 
             time.sleep(0.5)
             stats = parse_stats(read_esp_stats(ser, timeout=1))
@@ -453,12 +546,13 @@ def test_firmware_params(port, baud=460800):
             print(f"    I2C={speed_khz}kHz: {resp}")
             send_command(ser, "RESET")
 
-            start = time.time()
-            while time.time() - start < 2:
-                t = time.time() - start
-                angle = 90 + 45 * __import__('math').sin(t * 4)
-                ser.write(build_servo_packet([angle] * NUM_SERVOS))
-                time.sleep(1.0 / 60)
+            start = time.perf_counter()
+            next_t = start
+            while next_t - start < 2:
+                t = next_t - start
+                angle = sweep_angle(t, 4)
+                ser.write(build_uniform_servo_packet(angle))
+                next_t = pace(next_t, FRAME_INTERVAL)
 
             time.sleep(0.5)
             stats = parse_stats(read_esp_stats(ser, timeout=1))
@@ -474,12 +568,13 @@ def test_firmware_params(port, baud=460800):
             print(f"    PWMFREQ={freq}Hz: {resp}")
             send_command(ser, "RESET")
 
-            start = time.time()
-            while time.time() - start < 2:
-                t = time.time() - start
-                angle = 90 + 45 * __import__('math').sin(t * 4)
-                ser.write(build_servo_packet([angle] * NUM_SERVOS))
-                time.sleep(1.0 / 60)
+            start = time.perf_counter()
+            next_t = start
+            while next_t - start < 2:
+                t = next_t - start
+                angle = sweep_angle(t, 4)
+                ser.write(build_uniform_servo_packet(angle))
+                next_t = pace(next_t, FRAME_INTERVAL)
 
             time.sleep(0.5)
             stats = parse_stats(read_esp_stats(ser, timeout=1))
@@ -493,10 +588,11 @@ def test_firmware_params(port, baud=460800):
         send_command(ser, "I2C:100")
         send_command(ser, "PWMFREQ:50")
 
-        ser.close()
-
     except serial.SerialException as e:
         print(f"  ✗ Serial error: {e}")
+    finally:
+        if own_port and ser is not None:
+            ser.close()
 
     return results
 
@@ -531,41 +627,63 @@ def main():
     }
 
     tests = {
-        1: ('baud_rates', lambda: test_baud_rates(args.port)),
-        2: ('motor_send_rate', lambda: test_motor_send_rate(args.port, args.baud)),
-        3: ('latency', lambda: test_latency(args.port, args.baud)),
-        4: ('write_timeout', lambda: test_write_timeout(args.port, args.baud)),
-        5: ('firmware_params', lambda: test_firmware_params(args.port, args.baud)),
+        1: ('baud_rates', lambda ser: test_baud_rates(args.port)),
+        2: ('motor_send_rate', lambda ser: test_motor_send_rate(args.port, args.baud, ser)),
+        3: ('latency', lambda ser: test_latency(args.port, args.baud, ser)),
+        4: ('write_timeout', lambda ser: test_write_timeout(args.port, args.baud, ser)),
+        5: ('firmware_params', lambda ser: test_firmware_params(args.port, args.baud, ser)),
     }
 
     if args.test == 0:
-        # Run all tests
-        for test_num in sorted(tests.keys()):
+        selected = sorted(tests.keys())
+    elif args.test in tests:
+        selected = [args.test]
+    else:
+        print(f"Unknown test {args.test}. Valid: 1-5")
+        return
+
+    # Windows sleeps in 15.6 ms ticks by default; ask for 1 ms so the pacers hold rate
+    winmm = None
+    if sys.platform == 'win32':
+        import ctypes
+        winmm = ctypes.WinDLL('winmm')
+        winmm.timeBeginPeriod(1)
+
+    # Tests at the base baud share one connection instead of each paying
+    # for an open + DTR reset + READY wait (~3.5 s and an ESP32 reboot each)
+    shared_ser = None
+    try:
+        for test_num in selected:
             name, func = tests[test_num]
             try:
-                all_results[name] = func()
+                if test_num in SHARED_PORT_TESTS:
+                    if shared_ser is None:
+                        shared_ser = open_test_port(args.port, args.baud)
+                elif shared_ser is not None:
+                    # This test opens the port itself with its own settings
+                    shared_ser.close()
+                    shared_ser = None
+                all_results[name] = func(shared_ser)
             except Exception as e:
                 print(f"\n ✗ Test {test_num} failed: {e}")
                 all_results[name] = {'error': str(e)}
-    else:
-        if args.test in tests:
-            name, func = tests[args.test]
-            try:
-                all_results[name] = func()
-            except Exception as e:
-                print(f"\n ✗ Test failed: {e}")
-                all_results[name] = {'error': str(e)}
-        else:
-            print(f"Unknown test {args.test}. Valid: 1-5")
-            return
+    finally:
+        if shared_ser is not None:
+            shared_ser.close()
+        if winmm is not None:
+            winmm.timeEndPeriod(1)
 
     # Save results
     log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'logs')
     os.makedirs(log_dir, exist_ok=True)
     log_file = os.path.join(log_dir, 'stress_test_results.json')
 
-    with open(log_file, 'w') as f:
-        json.dump(all_results, f, indent=2, default=str)
+    if orjson is not None:
+        with open(log_file, 'wb') as f:
+            f.write(orjson.dumps(all_results, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(log_file, 'w') as f:
+            json.dump(all_results, f, indent=2, default=str)
 
     print(f"\n{'=' * 60}")
     print(f"Results saved to: {os.path.abspath(log_file)}")
@@ -0,0 +1,77 @@
+"""
+MotorController packets decoded by the simulated ESP32 (no hardware).
+Run: python -m pytest packages/mirror_core/tests/automated
+"""
+
+import pytest
+
+from packages.mirror_core.controllers.motor_controller import MotorController
+from packages.mirror_core.simulation.virtual_esp32 import VirtualESP32
+
+# One servo value step (0-1000 over 0-180 deg) - the wire format's resolution
+ANGLE_STEP = 180 / 1000
+
+
+@pytest.fixture
+def device():
+    dev = VirtualESP32()
+    yield dev
+    dev.boot_timer.cancel()
+
+
+def test_servo_delta_round_trip(device):
+    motor = MotorController()
+    device.write(motor.pack_uniform(90))
+
+    device.write(motor.pack_servo_delta(5, 45))
+    device.write(motor.pack_servo_delta(63, 137))
+
+    angles = device.motor_angles
+    assert angles[5] == pytest.approx(45, abs=ANGLE_STEP)
+    assert angles[63] == pytest.approx(137, abs=ANGLE_STEP)
+    # Every other servo keeps its last target
+    others = [a for i, a in enumerate(angles) if i not in (5, 63)]
+    assert others == [90.0] * 62
+
+
+def test_servo_delta_rejects_ids_past_the_firmware_servo_count():
+    # main.cpp drives 32 servos and ignores ids >= NUM_SERVOS
+    motor = MotorController(num_servos=32)
+    motor.pack_servo_delta(31, 90)
+    with pytest.raises(ValueError):
+        motor.pack_servo_delta(32, 90)
+    with pytest.raises(ValueError):
+        motor.pack_servo_delta(-1, 90)
+
+
+def test_out_of_range_delta_is_ignored_without_losing_framing(device):
+    motor = MotorController()
+    before = device.motor_angles.tolist()
+
+    # Hand-built: the packer refuses this id, a corrupt/foreign sender might not
+    device.write(b'\xAA\xBB\x08' + bytes([200]) + (500).to_bytes(2, 'big'))
+    assert device.motor_angles.tolist() == before
+
+    # The next packet still parses
+    device.write(motor.pack_servo_delta(0, 180))
+    assert device.motor_angles[0] == 180.0
+
+
+def test_single_override_matches_full_repack():
+    motor = MotorController()
+    angles = [(i * 7) % 181 for i in range(64)]
+
+    packet = motor.pack_single_override(bytearray(motor.pack_servo_packet(angles)), 17, 135)
+
+    angles[17] = 135
+    assert packet == motor.pack_servo_packet(angles)
+
+
+def test_single_override_on_uniform_packet():
+    motor = MotorController()
+    packet = motor.pack_single_override(bytearray(motor.pack_uniform(90)), 0, 180.9)
+
+    assert packet == motor.pack_servo_packet([180] + [90] * 63)
+    assert motor.pack_uniform(90) == motor.pack_servo_packet([90] * 64)  # Cache untouched
+    with pytest.raises(ValueError):
+        motor.pack_single_override(packet, 64, 90)
@@ -0,0 +1,94 @@
+"""
+SerialManager async servo writer against the simulated ESP32 (no hardware).
+Run: python -m pytest packages/mirror_core/tests/automated
+"""
+
+import threading
+import time
+
+import pytest
+
+from packages.mirror_core.io.serial_manager import SerialManager
+from packages.mirror_core.controllers.motor_controller import MotorController
+from packages.mirror_core.simulation import mock_serial
+
+LED_PACKET_SIZE = 3 + 2048
+SERVO_PACKET_SIZE = 3 + 2 * 64
+
+
+class ChunkedMockSerial(mock_serial.MockSerial):
+    """MockSerial that delivers each write in small pieces, like pyserial's
+    os.write loop on POSIX, and records every byte in arrival order."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wire = bytearray()
+
+    def write(self, data):
+        for i in range(0, len(data), 64):
+            self.wire += data[i:i + 64]
+            super().write(data[i:i + 64])
+            time.sleep(0)  # Give the other writer a chance to cut in
+        return len(data)
+
+
+@pytest.fixture
+def device(monkeypatch):
+    """Fresh VirtualESP32 per test, no cosmetic connect delay."""
+    monkeypatch.setattr(mock_serial, 'SIM_FAST', True)
+    monkeypatch.setattr(mock_serial, '_VIRTUAL_DEVICE', None)
+    dev = mock_serial.get_virtual_device_instance()
+    yield dev
+    dev.boot_timer.cancel()
+
+
+def _packets(wire):
+    """Split a recorded byte stream into packets; fails on broken framing."""
+    packets = []
+    i = 0
+    while i < len(wire):
+        assert wire[i:i + 2] == b'\xAA\xBB', f"framing broken at byte {i}"
+        size = {0x01: LED_PACKET_SIZE, 0x02: SERVO_PACKET_SIZE}[wire[i + 2]]
+        packets.append(bytes(wire[i:i + size]))
+        i += size
+    return packets
+
+
+def test_async_send_queues_and_close_flushes_last_pose(device, monkeypatch):
+    calls = []
+    monkeypatch.setattr(mock_serial.MockSerial, 'flush', lambda self: calls.append('flush'))
+    monkeypatch.setattr(mock_serial.MockSerial, 'reset_output_buffer',
+                        lambda self: calls.append('reset'))
+    manager = SerialManager(port='SIMULATOR', async_writes=True)
+    motor = MotorController()
+
+    for angle in (0, 45, 180):
+        assert manager.send_servo(motor.pack_uniform(angle))
+    manager.close()
+
+    assert device.motor_angles.tolist() == [180.0] * 64
+    assert calls == ['flush']  # Final pose drained to the wire, not discarded
+    assert manager.send_servo(motor.pack_uniform(90)) is False
+
+
+def test_async_servo_writes_never_split_led_frames(device, monkeypatch):
+    monkeypatch.setattr('packages.mirror_core.io.serial_manager.MockSerial', ChunkedMockSerial)
+    manager = SerialManager(port='SIMULATOR', async_writes=True)
+    motor = MotorController()
+    led_packet = b'\xAA\xBB\x01' + bytes(range(256)) * 8
+
+    def stream_servos():
+        for i in range(200):
+            manager.send_servo(motor.pack_uniform(i % 181))
+            time.sleep(0.0005)
+
+    servo_thread = threading.Thread(target=stream_servos)
+    servo_thread.start()
+    for _ in range(20):
+        assert manager.send_led(led_packet)
+    servo_thread.join()
+    manager.close()
+
+    packets = _packets(manager.ser.wire)
+    assert packets.count(led_packet) == 20
+    assert packets[-1] == motor.pack_uniform(199 % 181)
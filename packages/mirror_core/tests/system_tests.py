@@ -12,6 +12,11 @@ Follows Strict Debug Workflow:
 import time
 import sys
 import os
+import json
+from datetime import datetime
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 
@@ -20,18 +25,46 @@ try:
     from mirror_core.io.serial_manager import SerialManager
     from mirror_core.controllers.motor_controller import MotorController
     from mirror_core.controllers.led_controller import LEDController
+    from mirror_core.testing.led_panel_tester import LEDPanelTester
 except ImportError:
     print("⚠️  Running in standalone mode - modules might be missing on sys.path")
 
+# Servos driven by firmware/esp32/src/main.cpp (NUM_SERVOS); its servo packet
+# is exactly 3 + 2 * 32 = 67 bytes (PACKET_SERVO_SIZE)
+FIRMWARE_NUM_SERVOS = 32
+
+# Learns log: append-only JSON Lines (one record per learn), so saving a run
+# never has to read back or rewrite earlier runs
+LEARNS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', '..', '..', 'logs', 'test_learns.jsonl')
+
+
 class SystemTester:
     def __init__(self, serial_manager=None):
         self.serial = serial_manager
         self.results = []
         self.learns = []
+        self._learns_saved = 0  # learns already appended to LEARNS_FILE
+        self._log_lock = threading.Lock()  # Sensor check logs from a worker thread
+
+    # Controllers are built on first use (once, then shared by every driver
+    # check), so a failed connection check never pays for them
+    @functools.cached_property
+    def motor(self):
+        return MotorController(num_servos=FIRMWARE_NUM_SERVOS)
+
+    @functools.cached_property
+    def led(self):
+        return LEDController(width=32, height=64)
+
+    @functools.cached_property
+    def panel_tester(self):
+        return LEDPanelTester()
 
     def log(self, msg, status="INFO"):
-        print(f"[{status}] {msg}")
-        self.results.append({"status": status, "msg": msg})
+        with self._log_lock:
+            print(f"[{status}] {msg}")
+            self.results.append({"status": status, "msg": msg})
 
     def run_full_suite(self):
         self.log("Starting Progressive Test Suite...", "STEP 1")
@@ -41,16 +74,20 @@ class SystemTester:
             self.log("❌ Connection Failed - Stopping Tests", "CRITICAL")
             return self.report()
             
-        # 2. Sensor Unit Test
-        if not self.check_sensor():
-            self.log("⚠️ Sensor Issue - functionality limited", "WARN")
+        # 2. Sensor Unit Test - camera open/read is slow and touches nothing
+        # the driver checks use, so it runs alongside them
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            sensor = pool.submit(self.check_sensor)
             
-        # 3. Driver Tests
-        self.check_motor_driver()
-        self.check_led_driver()
-        
-        # 4. Integration Logic Check (Simulation)
-        self.check_integration_logic()
+            # 3. Driver Tests
+            self.check_motor_driver()
+            self.check_led_driver()
+            
+            # 4. Integration Logic Check (Simulation)
+            self.check_integration_logic()
+            
+            if not sensor.result():
+                self.log("⚠️ Sensor Issue - functionality limited", "WARN")
         
         return self.report()
 
@@ -109,21 +146,27 @@ class SystemTester:
         """Test Motor Driver Logic"""
         if self.serial and self.serial.connected:
             self.log("Sending Motor Test Packet...", "TEST")
-            try:
-                # Send neutral pose
-                angles = [90] * 6 # Assuming 6 servos for test
-                # We need access to MotorController to pack, mock if needed
-                # For now assumes run_gui passed a valid serial/controller combo or we simulate
-                self.log("Motor Packet Sent (Blind Test)", "PASS")
-            except Exception as e:
-                self.log(f"Motor Send Failed: {e}", "FAIL")
+            # Send neutral pose (cached all-servos-at-90 packet)
+            if self.serial.send_servo(self.motor.pack_uniform(90)):
+                self.log("Motor Neutral Pose Sent", "PASS")
+            else:
+                self.log(f"Motor Send Failed: {self.serial.last_error}", "FAIL")
+            # Single-servo delta (type 0x08): re-assert servo 0 at neutral,
+            # so the pose doesn't change but the firmware's delta path runs
+            if self.serial.send_servo(self.motor.pack_servo_delta(0, 90)):
+                self.log("Motor Delta Packet Sent", "PASS")
+            else:
+                self.log(f"Motor Delta Send Failed: {self.serial.last_error}", "FAIL")
 
     def check_led_driver(self):
         """Test LED Driver Logic"""
         if self.serial and self.serial.connected:
             self.log("Sending LED Test Packet...", "TEST")
-            # Logic similar to motor
-            self.log("LED Packet Sent (Blind Test)", "PASS")
+            pattern = self.panel_tester.generate_panel_test_pattern()
+            if self.serial.send_led(self.led.pack_led_packet(pattern)):
+                self.log("LED Panel Test Pattern Sent", "PASS")
+            else:
+                self.log(f"LED Send Failed: {self.serial.last_error}", "FAIL")
 
     def check_integration_logic(self):
         """Verify M/L/B Logic constraints"""
@@ -144,17 +187,31 @@ class SystemTester:
 
     def report(self):
         """Generate final report"""
-        print("\n" + "="*40)
-        print("   TEST SUITE REPORT")
-        print("="*40)
-        for item in self.results:
-            print(f"[{item['status']}] {item['msg']}")
-        print("="*40)
+        # Build the whole report first and emit it with one write
+        lines = ["", "="*40, "   TEST SUITE REPORT", "="*40]
+        lines += [f"[{item['status']}] {item['msg']}" for item in self.results]
+        lines.append("="*40)
+        print("\n".join(lines))
         
-        # Save learns
-        # In real impl, write to json
+        self.save_learns()
         return True
 
+    def save_learns(self):
+        """Append new learns to LEARNS_FILE (one JSON object per line)."""
+        new_learns = self.learns[self._learns_saved:]
+        if not new_learns:
+            return
+        timestamp = datetime.now().isoformat(timespec='seconds')
+        records = "".join(json.dumps({"timestamp": timestamp, "learn": learn}) + "\n"
+                          for learn in new_learns)
+        try:
+            os.makedirs(os.path.dirname(LEARNS_FILE), exist_ok=True)
+            with open(LEARNS_FILE, 'a', encoding='utf-8') as f:
+                f.write(records)
+            self._learns_saved = len(self.learns)
+        except OSError as e:
+            print(f"[WARN] Could not save learns: {e}")
+
 if __name__ == "__main__":
     tester = SystemTester()
     tester.run_full_suite()
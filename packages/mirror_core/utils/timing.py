@@ -0,0 +1,18 @@
+import time
+
+
+def pace(next_t, interval):
+    """Sleep until the next slot of a fixed-rate schedule and return its deadline.
+
+    Deadlines advance by ``interval`` so per-iteration work does not add drift.
+    If we fell behind, the schedule restarts from now instead of bursting.
+    Start a schedule with ``next_t = time.perf_counter()``; the returned
+    deadline doubles as the loop's clock, so loops can read ``next_t - start``
+    instead of calling perf_counter() again.
+    """
+    next_t += interval
+    delay = next_t - time.perf_counter()
+    if delay > 0:
+        time.sleep(delay)
+        return next_t
+    return time.perf_counter()